@@ -2,17 +2,42 @@
 Module with all test fixtures.
 When a test fixtures is set as argument for a test function, it automatically runs at the start of the test.
 
+The netCDF files are deterministic, so every fixture is session scoped: each file is built once
+into a temporary directory for the whole test session and the path to it is returned to the tests.
+All dimensions, variables and global attributes are defined before any data is written, and files
+of which every value gets written have prefilling with fill values turned off. The files are
+created in memory (diskless) and persisted to disk in a single write when they are closed.
+None of the tests rely on netCDF-4 features, so most files use the classic 64-bit offset format,
+which avoids the HDF5 layer. The file for testing perform_all_checks uses the netCDF-4 format,
+which is what most netCDF files checked with this library use, so reading it through HDF5 stays tested.
+
  Functions:
+- _create_boundaries_check_variables: Creates the dimensions and variables shared by the netCDF files
+  for boundary checking.
+- _create_weather_variables: Creates the 'time' dimension and time series variables shared by the netCDF files
+  for existence and emptiness checking.
+- _create_location_variables: Creates the scalar variables shared by the netCDF files for existence
+  and emptiness checking.
+- _build_data_boundaries_check_success, _build_data_boundaries_check_fail, _build_existence_check,
+  _build_emptiness_check_full, _build_emptiness_check_mixed, _build_emptiness_check_empty,
+  _build_data_points_amount_check, _build_data_boundaries_check_multidim_var,
+  _build_adjacent_values_difference_check_multidim, _build_adjacent_values_difference_check,
+  _build_consecutive_identical_values_check, _build_all_checks: Create the netCDF file for the
+  test fixture of the same name.
+- _build_data_boundaries_check_property_based: Creates netCDF files for property based testing for boundary checks.
+- _make_read_only: Sets the mode of a netCDF test file to read-only.
+- fixture_nc_dir (fixture nc_dir): Session scoped temporary directory in which all netCDF test files are created.
 - create_nc_data_boundaries_check_success: Test fixture for testing boundary checking
   when all data falls within the boundaries.
 - create_nc_data_boundaries_check_fail: Test fixture for testing boundary checking
   when not all data falls within the boundaries.
-- create_nc_data_boundaries_check_property_based: Creates netCDF files for property based testing for boundary checks.
+- create_nc_data_boundaries_check_property_based: Test fixture returning a function that creates netCDF files
+  for property based testing for boundary checks.
 - create_nc_existence_check: Test fixture for testing existence checking.
 - create_nc_emptiness_check_full: Test fixture for testing boundary checking when everything is fully populated.
 - create_nc_emptiness_check_mixed: Test fixture for testing boundary checking when some things are not fully populated.
 - create_nc_emptiness_check_empty: Test fixture for testing boundary checking when nothing is populated.
-- create_data_points_amount_check: Test fixture for testing data_points_amount_check
+- create_nc_data_points_amount_check: Test fixture for testing data_points_amount_check
 - create_nc_data_boundaries_check_multidim_var: Test fixture for testing boundary
   checking when a variable is multidimensional
 - create_nc_adjacent_values_difference_check: Test fixture for testing
@@ -22,125 +47,150 @@ When a test fixtures is set as argument for a test function, it automatically ru
 - create_nc_consecutive_identical_values_check: Test fixture for testing max number
   of consecutive values that are the same.
 - create_nc_all_checks: Test fixture for testing perform_all_checks method from QualityControl class
+- fixture_load_qc_obj (fixture load_qc_obj): Test fixture returning a function that loads a netCDF file
+  into a new QualityControl object, which is closed after the last test of the module.
 """
 
 import os
+from functools import partial
 from pathlib import Path
-from typing import List
-from netCDF4 import Dataset
-import numpy as np
-import pytest
+from typing import Callable, Dict, Iterator, List, Tuple
 
+# None of the checks use multithreaded linear algebra, so numpy's BLAS backend does not need to start
+# a thread pool. This has to be set before numpy is imported, so it is done before the imports below.
+os.environ.setdefault('OMP_NUM_THREADS', '1')
 
-@pytest.fixture()
-def create_nc_data_boundaries_check_success():
-    """
-    Test fixture for testing boundary checking when all data falls within the boundaries.
-    """
-    nc_path = Path(__file__).parent / 'sample_data' / 'test_boundary_success.nc'
+from netCDF4 import Dataset, Variable  # pylint: disable=wrong-import-position
+import numpy as np  # pylint: disable=wrong-import-position
+import pytest  # pylint: disable=wrong-import-position
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
+from ncqc.QCnetCDF import QualityControl  # pylint: disable=wrong-import-position
 
-    # Create a new netCDF file
-    nc_file = Dataset(nc_path, 'w', format='NETCDF4')
+# The data only has to fall within the ranges the tests expect, so it is generated once
+# at import from a seeded generator and reused by every builder.
+_RNG = np.random.default_rng(0)
 
-    # Create dimensions
+_VELOCITY_SPREAD = _RNG.uniform(0, 3.3, size=32).astype('f4')
+_KINETIC_ENERGY = _RNG.uniform(0, 1.91, size=100).astype('f4')
+_KINETIC_ENERGY_BELOW_1_8 = _RNG.uniform(0, 1.8, size=99).astype('f4')
+_TEMPERATURE = _RNG.uniform(-10, 30, size=100).astype('f4')
+_WIND_SPEED = _RNG.uniform(0, 30, size=100).astype('f4')
+_WIND_DIRECTION = _RNG.uniform(0, 360, size=100).astype('f4')
+_VAR_1D = _RNG.uniform(low=0, high=100, size=10).astype('f4')
+_VAR_2D = _RNG.uniform(low=0, high=100, size=(10, 20)).astype('f4')
+_VAR_2D_UNIT = _RNG.uniform(low=0, high=1, size=(10, 20)).astype('f4')
+_VAR_1 = _RNG.uniform(low=1, high=10, size=50).astype('f4')
+_VAR_2 = _RNG.uniform(low=10, high=19, size=50).astype('f4')
+
+# 1.91 as stored in a 'f4' variable (1.909999966621399), just above the upper bound of 1.8
+_BOUNDARY_FAIL_VALUE = np.float32(1.91)
+
+# Data each property based test file was last built with
+_PROPERTY_BASED_DATA_BUILT: Dict[Path, List[int]] = {}
+
+
+def _create_boundaries_check_variables(nc_file: Dataset) -> Tuple[Variable, Variable]:
+    """
+    Creates the dimensions and variables shared by the netCDF files for boundary checking.
+    :param nc_file: the netCDF file to add the dimensions and variables to
+    :return: the 'velocity_spread' and 'kinetic_energy' variables
+    """
     nc_file.createDimension('time', 100)
     nc_file.createDimension('diameter_classes', 32)
     nc_file.createDimension('velocity_classes', 32)
 
-    # Create variables
     velocity_spread = nc_file.createVariable('velocity_spread', 'f4', ('velocity_classes',), fill_value=-1.0)
     kinetic_energy = nc_file.createVariable('kinetic_energy', 'f4', ('time',), fill_value=-1.0)
+    return velocity_spread, kinetic_energy
 
-    # Set variables
-    velocity_spread[:] = np.random.uniform(0, 3.3, size=32)
-    kinetic_energy[:] = np.random.uniform(0, 1.91, size=100)
 
-    # Close the netCDF file
-    nc_file.close()
+def _create_weather_variables(nc_file: Dataset) -> Tuple[Variable, Variable, Variable]:
+    """
+    Creates the 'time' dimension and time series variables shared by the netCDF files for existence
+    and emptiness checking.
+    :param nc_file: the netCDF file to add the dimension and variables to
+    :return: the 'temperature', 'wind_speed' and 'wind_direction' variables
+    """
+    nc_file.createDimension('time', 100)
+
+    temperature = nc_file.createVariable('temperature', 'f4', ('time',), fill_value=-999.0)
+    wind_speed = nc_file.createVariable('wind_speed', 'f4', ('time',), fill_value=-999.0)
+    wind_direction = nc_file.createVariable('wind_direction', 'f4', ('time',), fill_value=-999.0)
+    return temperature, wind_speed, wind_direction
 
 
-@pytest.fixture()
-def create_nc_data_boundaries_check_fail():
+def _create_location_variables(nc_file: Dataset) -> Tuple[Variable, Variable, Variable]:
     """
-    Test fixture for testing boundary checking when not all data falls within the boundaries.
+    Creates the scalar variables shared by the netCDF files for existence and emptiness checking.
+    :param nc_file: the netCDF file to add the variables to
+    :return: the 'longitude', 'latitude' and 'altitude' variables
     """
-    nc_path = Path(__file__).parent / 'sample_data' / 'test_boundary_fail.nc'
+    longitude = nc_file.createVariable('longitude', 'f4', fill_value=-999.0)
+    latitude = nc_file.createVariable('latitude', 'f4', fill_value=-999.0)
+    altitude = nc_file.createVariable('altitude', 'f4', fill_value=-999.0)
+    return longitude, latitude, altitude
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
 
+def _build_data_boundaries_check_success(nc_path: Path) -> Path:
+    """
+    Creates the netCDF file for testing boundary checking when all data falls within the boundaries.
+    :param nc_path: path of the netCDF file to create
+    :return: path of the created netCDF file
+    """
     # Create a new netCDF file
-    nc_file = Dataset(nc_path, 'w', format='NETCDF4')
+    nc_file = Dataset(nc_path, 'w', format='NETCDF3_64BIT_OFFSET', diskless=True, persist=True)
+    nc_file.set_fill_off()
 
-    # Create dimensions
-    nc_file.createDimension('time', 100)
-    nc_file.createDimension('diameter_classes', 32)
-    nc_file.createDimension('velocity_classes', 32)
-
-    # Create variables
-    velocity_spread = nc_file.createVariable('velocity_spread', 'f4', ('velocity_classes',), fill_value=-1.0)
-    kinetic_energy = nc_file.createVariable('kinetic_energy', 'f4', ('time',), fill_value=-1.0)
+    # Create dimensions and variables
+    velocity_spread, kinetic_energy = _create_boundaries_check_variables(nc_file)
 
     # Set variables
-    velocity_spread[:] = np.random.uniform(0, 3.3, size=32)
-    kinetic_energy[:99] = np.random.uniform(0, 1.8, size=99)
-    kinetic_energy[99:] = 1.909999966621399
+    velocity_spread[:] = _VELOCITY_SPREAD
+    kinetic_energy[:] = _KINETIC_ENERGY
 
     # Close the netCDF file
     nc_file.close()
+    return nc_path
 
 
-def create_nc_data_boundaries_check_property_based(data: List[int]):
+def _build_data_boundaries_check_fail(nc_path: Path) -> Path:
     """
-    Function to create netCDF files for property based testing for boundary checks.
-    :param data: the list of data points generated by the property based test
+    Creates the netCDF file for testing boundary checking when not all data falls within the boundaries.
+    :param nc_path: path of the netCDF file to create
+    :return: path of the created netCDF file
     """
-    nc_path = Path(__file__).parent / 'sample_data' / 'test_boundary_property.nc'
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
     # Create a new netCDF file
-    nc_file = Dataset(nc_path, 'w', format='NETCDF4')
+    nc_file = Dataset(nc_path, 'w', format='NETCDF3_64BIT_OFFSET', diskless=True, persist=True)
+    nc_file.set_fill_off()
 
     # Create dimensions and variables
-    nc_file.createDimension('time', len(data))
-    temperature = nc_file.createVariable('temperature', 'f4', ('time',), fill_value=-1.0)
-    temperature[:] = data
+    velocity_spread, kinetic_energy = _create_boundaries_check_variables(nc_file)
+
+    # Set variables
+    velocity_spread[:] = _VELOCITY_SPREAD
+    kinetic_energy[:99] = _KINETIC_ENERGY_BELOW_1_8
+    kinetic_energy[99:] = _BOUNDARY_FAIL_VALUE
 
     # Close the netCDF file
     nc_file.close()
+    return nc_path
 
 
-@pytest.fixture()
-def create_nc_existence_check():
+def _build_existence_check(nc_path: Path) -> Path:
     """
-    Test fixture for testing existence checking.
+    Creates the netCDF file for testing existence checking.
+    :param nc_path: path of the netCDF file to create
+    :return: path of the created netCDF file
     """
-    nc_path = Path(__file__).parent / 'sample_data' / 'test_existence.nc'
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
     # Create a new netCDF file
-    nc_file = Dataset(nc_path, 'w', format='NETCDF4')
+    nc_file = Dataset(nc_path, 'w', format='NETCDF3_64BIT_OFFSET', diskless=True, persist=True)
 
-    # Create dimensions
-    nc_file.createDimension('time', 100)
+    # Create dimensions and variables, the existence tests also check the class dimensions
+    _create_weather_variables(nc_file)
+    _create_location_variables(nc_file)
     nc_file.createDimension('diameter_classes', 32)
     nc_file.createDimension('velocity_classes', 32)
 
-    # Create variables
-    nc_file.createVariable('temperature', 'f4', ('time',), fill_value=-999.0)
-    nc_file.createVariable('wind_speed', 'f4', ('time',), fill_value=-999.0)
-    nc_file.createVariable('wind_direction', 'f4', ('time',), fill_value=-999.0)
-    nc_file.createVariable('longitude', 'f4', fill_value=-999.0)
-    nc_file.createVariable('latitude', 'f4', fill_value=-999.0)
-    nc_file.createVariable('altitude', 'f4', fill_value=-999.0)
-
     # Create global attributes
     nc_file.title = "Test NetCDF File"
     nc_file.source = "confest.py"
@@ -148,140 +198,111 @@ def create_nc_existence_check():
 
     # Close the netCDF file
     nc_file.close()
+    return nc_path
 
 
-@pytest.fixture()
-def create_nc_emptiness_check_full():
+def _build_emptiness_check_full(nc_path: Path) -> Path:
     """
-    Test fixture for testing boundary checking when everything is fully populated.
+    Creates the netCDF file for testing emptiness checking when everything is fully populated.
+    :param nc_path: path of the netCDF file to create
+    :return: path of the created netCDF file
     """
-    nc_path = Path(__file__).parent / 'sample_data' / 'test_emptiness_full.nc'
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
     # Create a new netCDF file
-    nc_file = Dataset(nc_path, 'w', format='NETCDF4')
+    nc_file = Dataset(nc_path, 'w', format='NETCDF3_64BIT_OFFSET', diskless=True, persist=True)
+    nc_file.set_fill_off()
 
-    # Create dimensions
-    nc_file.createDimension('time', 100)
-    nc_file.createDimension('diameter_classes', 32)
-    nc_file.createDimension('velocity_classes', 32)
-
-    # Create variables
-    temperature = nc_file.createVariable('temperature', 'f4', ('time',), fill_value=-999.0)
-    wind_speed = nc_file.createVariable('wind_speed', 'f4', ('time',), fill_value=-999.0)
-    wind_direction = nc_file.createVariable('wind_direction', 'f4', ('time',), fill_value=-999.0)
-
-    # Set variables
-    temperature[:] = np.random.uniform(-10, 30, size=100)
-    wind_speed[:] = np.random.uniform(0, 30, size=100)
-    wind_direction[:] = np.random.uniform(0, 360, size=100)
+    # Create dimensions and variables
+    temperature, wind_speed, wind_direction = _create_weather_variables(nc_file)
 
     # Create global attributes
     nc_file.title = "Test NetCDF File"
     nc_file.source = "confest.py"
     nc_file.contributors = "people"
 
+    # Set variables
+    temperature[:] = _TEMPERATURE
+    wind_speed[:] = _WIND_SPEED
+    wind_direction[:] = _WIND_DIRECTION
+
     # Close the netCDF file
     nc_file.close()
+    return nc_path
 
 
-@pytest.fixture()
-def create_nc_emptiness_check_mixed():
+def _build_emptiness_check_mixed(nc_path: Path) -> Path:
     """
-    Test fixture for testing boundary checking when some things are not fully populated.
+    Creates the netCDF file for testing emptiness checking when some things are not fully populated.
+    :param nc_path: path of the netCDF file to create
+    :return: path of the created netCDF file
     """
-    nc_path = Path(__file__).parent / 'sample_data' / 'test_emptiness_mixed.nc'
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
     # Create a new netCDF file
-    nc_file = Dataset(nc_path, 'w', format='NETCDF4')
+    nc_file = Dataset(nc_path, 'w', format='NETCDF3_64BIT_OFFSET', diskless=True, persist=True)
+    nc_file.set_fill_off()
 
-    # Create dimensions
-    nc_file.createDimension('time', 100)
-    nc_file.createDimension('diameter_classes', 32)
-    nc_file.createDimension('velocity_classes', 32)
+    # Create dimensions and variables
+    temperature, wind_speed, wind_direction = _create_weather_variables(nc_file)
+    longitude, latitude, altitude = _create_location_variables(nc_file)
 
-    # Create variables
-    temperature = nc_file.createVariable('temperature', 'f4', ('time',), fill_value=-999.0)
-    wind_speed = nc_file.createVariable('wind_speed', 'f4', ('time',), fill_value=-999.0)
-    wind_direction = nc_file.createVariable('wind_direction', 'f4', ('time',), fill_value=-999.0)
-    longitude = nc_file.createVariable('longitude', 'f4', fill_value=-999.0)
-    latitude = nc_file.createVariable('latitude', 'f4', fill_value=-999.0)
-    altitude = nc_file.createVariable('altitude', 'f4', fill_value=-999.0)
+    # Create global attributes
+    nc_file.title = "Test NetCDF File"
+    nc_file.source = "confest.py"
+    nc_file.contributors = ""
 
     # Set variables
-    temperature[:] = np.random.uniform(-10, 30, size=100)
+    temperature[:] = _TEMPERATURE
 
-    wind_speed[:50] = np.random.uniform(0, 30, size=50)
-    wind_speed[50:] = wind_speed.getncattr('_FillValue')
+    # first half populated, second half the fill value
+    wind_speed_values = np.full(100, wind_speed.getncattr('_FillValue'), dtype='f4')
+    wind_speed_values[:50] = _WIND_SPEED[:50]
+    wind_speed[:] = wind_speed_values
 
-    wind_direction[:50] = np.random.uniform(0, 360, size=50)
-    wind_direction[50:] = np.nan
+    # first half populated, second half NaN
+    wind_direction_values = np.full(100, np.nan, dtype='f4')
+    wind_direction_values[:50] = _WIND_DIRECTION[:50]
+    wind_direction[:] = wind_direction_values
 
     longitude.assignValue(longitude.getncattr('_FillValue'))
     latitude.assignValue(np.nan)
     altitude.assignValue(1.0)
 
-    # Create global attributes
-    nc_file.title = "Test NetCDF File"
-    nc_file.source = "confest.py"
-    nc_file.contributors = ""
-
     # Close the netCDF file
     nc_file.close()
+    return nc_path
 
 
-@pytest.fixture()
-def create_nc_emptiness_check_empty():
+def _build_emptiness_check_empty(nc_path: Path) -> Path:
     """
-    Test fixture for testing boundary checking when nothing is populated.
+    Creates the netCDF file for testing emptiness checking when nothing is populated.
+    :param nc_path: path of the netCDF file to create
+    :return: path of the created netCDF file
     """
-    nc_path = Path(__file__).parent / 'sample_data' / 'test_emptiness_empty.nc'
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
     # Create a new netCDF file
-    nc_file = Dataset(nc_path, 'w', format='NETCDF4')
-
-    # Create dimensions
-    nc_file.createDimension('time', 100)
-    nc_file.createDimension('diameter_classes', 32)
-    nc_file.createDimension('velocity_classes', 32)
+    nc_file = Dataset(nc_path, 'w', format='NETCDF3_64BIT_OFFSET', diskless=True, persist=True)
 
-    # Create variables
-    nc_file.createVariable('temperature', 'f4', ('time',), fill_value=-999.0)
-    wind_speed = nc_file.createVariable('wind_speed', 'f4', ('time',), fill_value=-999.0)
-    wind_direction = nc_file.createVariable('wind_direction', 'f4', ('time',), fill_value=-999.0)
-
-    # Set variables
-    wind_speed[:] = wind_speed.getncattr('_FillValue')
-    wind_direction[:] = np.nan
+    # Create dimensions and variables
+    _, _, wind_direction = _create_weather_variables(nc_file)
 
     # Create global attributes
     nc_file.title = ""
     nc_file.source = ""
     nc_file.contributors = ""
 
+    # Set variables, 'temperature' and 'wind_speed' are left at their fill value
+    wind_direction[:] = np.nan
+
     # Close the netCDF file
     nc_file.close()
+    return nc_path
 
 
-@pytest.fixture()
-def create_nc_data_points_amount_check():
+def _build_data_points_amount_check(nc_path: Path) -> Path:
     """
-    Test fixture for testing data_points_amount_check
+    Creates the netCDF file for testing data_points_amount_check
+    :param nc_path: path of the netCDF file to create
+    :return: path of the created netCDF file
     """
-    nc_path = Path(__file__).parent / 'sample_data' / 'test_data_points_amount.nc'
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
-    nc_file = Dataset(nc_path, 'w', format='NETCDF4')
+    nc_file = Dataset(nc_path, 'w', format='NETCDF3_64BIT_OFFSET', diskless=True, persist=True)
+    nc_file.set_fill_off()
 
     nc_file.createDimension('dimension_1', 10)
     nc_file.createDimension('dimension_2', 20)
@@ -289,48 +310,44 @@ def create_nc_data_points_amount_check():
     var_1d = nc_file.createVariable('var_1d', 'f4', ('dimension_1',), fill_value=-999.0)
     var_2d = nc_file.createVariable('var_2d', 'f4', ('dimension_1', 'dimension_2'), fill_value=-999.0)
 
-    var_1d[:] = np.random.uniform(low=0, high=100, size=10)
-    var_2d[:, :] = np.random.uniform(low=0, high=100, size=(10, 20))
+    var_1d[:] = _VAR_1D
+    var_2d[:, :] = _VAR_2D
 
     nc_file.close()
+    return nc_path
 
 
-@pytest.fixture()
-def create_nc_data_boundaries_check_multidim_var():
+def _build_data_boundaries_check_multidim_var(nc_path: Path) -> Path:
     """
-    Test fixture for testing boundary checking when a variable is multidimensional
+    Creates the netCDF file for testing boundary checking when a variable is multidimensional
+    :param nc_path: path of the netCDF file to create
+    :return: path of the created netCDF file
     """
-    nc_path = Path(__file__).parent / 'sample_data' / 'test_boundary_multidim.nc'
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
-    nc_file = Dataset(nc_path, 'w', format='NETCDF4')
+    nc_file = Dataset(nc_path, 'w', format='NETCDF3_64BIT_OFFSET', diskless=True, persist=True)
+    nc_file.set_fill_off()
 
     nc_file.createDimension('dim_1', 10)
     nc_file.createDimension('dim_2', 20)
 
     var_2d = nc_file.createVariable('var_2d', 'f4', ('dim_1', 'dim_2'), fill_value=-999.0)
 
-    var_2d[:9, :] = np.random.uniform(low=0, high=1, size=(9, 20))
-    var_2d[9, :19] = np.random.uniform(low=0, high=1, size=(1, 19))
+    var_2d[:9, :] = _VAR_2D_UNIT[:9, :]
+    var_2d[9, :19] = _VAR_2D_UNIT[9, :19]
     var_2d[9, 19] = 1.01
 
     nc_file.close()
+    return nc_path
 
 
-@pytest.fixture()
-def create_nc_adjacent_values_difference_check_multidim():
+def _build_adjacent_values_difference_check_multidim(nc_path: Path) -> Path:
     """
-    Test fixture for testing adjacent_values_difference_check with multidimensional variable.
+    Creates the netCDF file for testing adjacent_values_difference_check with multidimensional variable.
+    :param nc_path: path of the netCDF file to create
+    :return: path of the created netCDF file
     """
-    nc_path = Path(__file__).parent / 'sample_data' / 'test_adjacent_values_difference_check.nc'
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
     # Create a new netCDF file
-    nc_file = Dataset(nc_path, 'w', format='NETCDF4')
+    nc_file = Dataset(nc_path, 'w', format='NETCDF3_64BIT_OFFSET', diskless=True, persist=True)
+    nc_file.set_fill_off()
 
     # create dimensions
     nc_file.createDimension('dim_1', 10)
@@ -339,21 +356,21 @@ def create_nc_adjacent_values_difference_check_multidim():
     # create variable
     var_2d = nc_file.createVariable('var_2d', 'f4', ('dim_1', 'dim_2'), fill_value=-999.0)
     var_2d[:] = np.ones((10, 10))
+
     # Close the netCDF file
     nc_file.close()
+    return nc_path
+
 
-@pytest.fixture()
-def create_nc_adjacent_values_difference_check():
+def _build_adjacent_values_difference_check(nc_path: Path) -> Path:
     """
-    Test fixture for testing adjacent_values_difference_check.
+    Creates the netCDF file for testing adjacent_values_difference_check.
+    :param nc_path: path of the netCDF file to create
+    :return: path of the created netCDF file
     """
-    nc_path = Path(__file__).parent / 'sample_data' / 'test_adjacent_values_difference_check.nc'
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
     # Create a new netCDF file
-    nc_file = Dataset(nc_path, 'w', format='NETCDF4')
+    nc_file = Dataset(nc_path, 'w', format='NETCDF3_64BIT_OFFSET', diskless=True, persist=True)
+    nc_file.set_fill_off()
 
     # Create dimensions
     nc_file.createDimension('time', 100)
@@ -370,20 +387,18 @@ def create_nc_adjacent_values_difference_check():
 
     # Close the netCDF file
     nc_file.close()
+    return nc_path
 
 
-@pytest.fixture()
-def create_nc_consecutive_identical_values_check():
+def _build_consecutive_identical_values_check(nc_path: Path) -> Path:
     """
-    Test fixture for testing max number of consecutive values that are the same.
+    Creates the netCDF file for testing max number of consecutive values that are the same.
+    :param nc_path: path of the netCDF file to create
+    :return: path of the created netCDF file
     """
-    nc_path = Path(__file__).parent / 'sample_data' / 'test_consecutive_identical_values_check.nc'
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
     # Create a new netCDF file
-    nc_file = Dataset(nc_path, 'w', format='NETCDF4')
+    nc_file = Dataset(nc_path, 'w', format='NETCDF3_64BIT_OFFSET', diskless=True, persist=True)
+    nc_file.set_fill_off()
 
     # Create dimensions
     nc_file.createDimension('time', 100)
@@ -393,25 +408,24 @@ def create_nc_consecutive_identical_values_check():
     test_fail = nc_file.createVariable('test_fail', 'f4', ('time',), fill_value=-1.0)
 
     # Set variables
-    test_pass[:] = np.ones(100)
-    test_pass[::2] = 0
+    # alternating zeros and ones [0,1,0,1,...,0,1]
+    test_pass[:] = np.tile(np.array([0.0, 1.0], dtype='f4'), 50)
     test_fail[:] = np.ones(100)
 
     # Close the netCDF file
     nc_file.close()
+    return nc_path
 
 
-@pytest.fixture()
-def create_nc_all_checks():
+def _build_all_checks(nc_path: Path) -> Path:
     """
-    Test fixture for testing perform_all_checks method from QualityControl class
+    Creates the netCDF file for testing perform_all_checks method from QualityControl class.
+    Unlike the other files it uses the netCDF-4 format, so the HDF5 based read path stays tested.
+    :param nc_path: path of the netCDF file to create
+    :return: path of the created netCDF file
     """
-    nc_path = Path(__file__).parent / 'sample_data' / 'test_all_checks.nc'
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
-    nc_file = Dataset(nc_path, 'w', format='NETCDF4')
+    nc_file = Dataset(nc_path, 'w', format='NETCDF4', diskless=True, persist=True)
+    nc_file.set_fill_off()
 
     nc_file.attr_1 = 'attr_1'
 
@@ -420,7 +434,185 @@ def create_nc_all_checks():
     var_1 = nc_file.createVariable('var_1', 'f4', ('dim_1',), fill_value=-999.0)
     var_2 = nc_file.createVariable('var_2', 'f4', ('dim_1',), fill_value=-999.0)
 
-    var_1[:] = np.random.uniform(low=1, high=10, size=50)
-    var_2[:] = np.random.uniform(low=10, high=19, size=50)
+    var_1[:] = _VAR_1
+    var_2[:] = _VAR_2
 
     nc_file.close()
+    return nc_path
+
+
+def _build_data_boundaries_check_property_based(nc_directory: Path, data: List[int]) -> Path:
+    """
+    Function to create netCDF files for property based testing for boundary checks.
+    :param nc_directory: directory in which the netCDF file is created
+    :param data: the list of data points generated by the property based test
+    :return: path of the created netCDF file
+    """
+    nc_path = nc_directory / 'test_boundary_property.nc'
+
+    # hypothesis can generate the same data more than once, the file is only rebuilt when the data changed
+    if nc_path.exists() and _PROPERTY_BASED_DATA_BUILT.get(nc_path) == data:
+        return nc_path
+
+    # Create a new netCDF file
+    nc_file = Dataset(nc_path, 'w', format='NETCDF3_64BIT_OFFSET', diskless=True, persist=True)
+    nc_file.set_fill_off()
+
+    # Create dimensions and variables
+    nc_file.createDimension('time', len(data))
+    temperature = nc_file.createVariable('temperature', 'f4', ('time',), fill_value=-1.0)
+    temperature[:] = data
+
+    # Close the netCDF file
+    nc_file.close()
+
+    _PROPERTY_BASED_DATA_BUILT[nc_path] = list(data)
+    return nc_path
+
+
+def _make_read_only(nc_path: Path) -> Path:
+    """
+    Sets the mode of a netCDF test file to read-only. The files are shared by all tests of the session
+    and no test should write to them, the mode documents that intent. It does not stop processes running
+    as root, such as the CI container, from writing to the file.
+    :param nc_path: path to the netCDF file
+    :return: path to the netCDF file
+    """
+    nc_path.chmod(0o444)
+    return nc_path
+
+
+@pytest.fixture(scope="session", name="nc_dir")
+def fixture_nc_dir(tmp_path_factory) -> Path:
+    """
+    Session scoped temporary directory in which all netCDF test files are created.
+    :param tmp_path_factory: pytest factory for session scoped temporary directories
+    :return: path to the directory
+    """
+    return tmp_path_factory.mktemp('sample_data')
+
+
+@pytest.fixture(scope="session")
+def create_nc_data_boundaries_check_property_based(nc_dir) -> Callable[[List[int]], Path]:
+    """
+    Test fixture for property based testing for boundary checks. hypothesis generates the data inside
+    the test, so the fixture returns a function that creates the netCDF file for the given data.
+    """
+    return partial(_build_data_boundaries_check_property_based, nc_dir)
+
+
+@pytest.fixture(scope="session")
+def create_nc_data_boundaries_check_success(nc_dir) -> Path:
+    """
+    Test fixture for testing boundary checking when all data falls within the boundaries.
+    """
+    return _make_read_only(_build_data_boundaries_check_success(nc_dir / 'test_boundary_success.nc'))
+
+
+@pytest.fixture(scope="session")
+def create_nc_data_boundaries_check_fail(nc_dir) -> Path:
+    """
+    Test fixture for testing boundary checking when not all data falls within the boundaries.
+    """
+    return _make_read_only(_build_data_boundaries_check_fail(nc_dir / 'test_boundary_fail.nc'))
+
+
+@pytest.fixture(scope="session")
+def create_nc_existence_check(nc_dir) -> Path:
+    """
+    Test fixture for testing existence checking.
+    """
+    return _make_read_only(_build_existence_check(nc_dir / 'test_existence.nc'))
+
+
+@pytest.fixture(scope="session")
+def create_nc_emptiness_check_full(nc_dir) -> Path:
+    """
+    Test fixture for testing boundary checking when everything is fully populated.
+    """
+    return _make_read_only(_build_emptiness_check_full(nc_dir / 'test_emptiness_full.nc'))
+
+
+@pytest.fixture(scope="session")
+def create_nc_emptiness_check_mixed(nc_dir) -> Path:
+    """
+    Test fixture for testing boundary checking when some things are not fully populated.
+    """
+    return _make_read_only(_build_emptiness_check_mixed(nc_dir / 'test_emptiness_mixed.nc'))
+
+
+@pytest.fixture(scope="session")
+def create_nc_emptiness_check_empty(nc_dir) -> Path:
+    """
+    Test fixture for testing boundary checking when nothing is populated.
+    """
+    return _make_read_only(_build_emptiness_check_empty(nc_dir / 'test_emptiness_empty.nc'))
+
+
+@pytest.fixture(scope="session")
+def create_nc_data_points_amount_check(nc_dir) -> Path:
+    """
+    Test fixture for testing data_points_amount_check
+    """
+    return _make_read_only(_build_data_points_amount_check(nc_dir / 'test_data_points_amount.nc'))
+
+
+@pytest.fixture(scope="session")
+def create_nc_data_boundaries_check_multidim_var(nc_dir) -> Path:
+    """
+    Test fixture for testing boundary checking when a variable is multidimensional
+    """
+    return _make_read_only(_build_data_boundaries_check_multidim_var(nc_dir / 'test_boundary_multidim.nc'))
+
+
+@pytest.fixture(scope="session")
+def create_nc_adjacent_values_difference_check_multidim(nc_dir) -> Path:
+    """
+    Test fixture for testing adjacent_values_difference_check with multidimensional variable.
+    """
+    return _make_read_only(_build_adjacent_values_difference_check_multidim(
+        nc_dir / 'test_adjacent_values_difference_check_multidim.nc'))
+
+
+@pytest.fixture(scope="session")
+def create_nc_adjacent_values_difference_check(nc_dir) -> Path:
+    """
+    Test fixture for testing adjacent_values_difference_check.
+    """
+    return _make_read_only(_build_adjacent_values_difference_check(nc_dir / 'test_adjacent_values_difference_check.nc'))
+
+
+@pytest.fixture(scope="session")
+def create_nc_consecutive_identical_values_check(nc_dir) -> Path:
+    """
+    Test fixture for testing max number of consecutive values that are the same.
+    """
+    return _make_read_only(
+        _build_consecutive_identical_values_check(nc_dir / 'test_consecutive_identical_values_check.nc'))
+
+
+@pytest.fixture(scope="session")
+def create_nc_all_checks(nc_dir) -> Path:
+    """
+    Test fixture for testing perform_all_checks method from QualityControl class
+    """
+    return _make_read_only(_build_all_checks(nc_dir / 'test_all_checks.nc'))
+
+
+@pytest.fixture(scope="module", name="load_qc_obj")
+def fixture_load_qc_obj() -> Iterator[Callable[[Path], QualityControl]]:
+    """
+    Test fixture returning a function that loads a netCDF file into a new QualityControl object.
+    The objects are meant to be shared by the tests of a module, so each test clears the logger and
+    replaces the checks. The loaded netCDF files are closed after the last test of the module.
+    """
+    qc_objs = []
+
+    def load(nc_path: Path) -> QualityControl:
+        qc_obj = QualityControl().load_netcdf(nc_path)
+        qc_objs.append(qc_obj)
+        return qc_obj
+
+    yield load
+    for qc_obj in qc_objs:
+        qc_obj.nc.close()
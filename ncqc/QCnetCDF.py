@@ -6,7 +6,7 @@ Module dedicated to the main logic of the netCDF quality control library
 """
 
 from pathlib import Path
-from typing import Union
+from typing import Mapping, Optional, Union
 
 import netCDF4
 import yaml
@@ -27,6 +27,7 @@ class QualityControl:
     - qc_check_file_size: check for the file size of a netCDF file
     - nc: netCDF file to be checked
     - logger: logger for errors, warnings, info, and creation of reports
+    - _data_cache: values of the variables read during the current perform_all_checks call, None outside of it
 
      Methods:
     - add_qc_checks_conf: add checks via a config file
@@ -34,6 +35,7 @@ class QualityControl:
     - replace_qc_checks_conf: replace checks via a config file
     - replace_qc_checks_dict: replace checks via a dictionary
     - load_netcdf: load the netcdf file to be checked
+    - load_netcdf_from_handle: load an already opened netCDF dataset to be checked
     - data_boundaries_check: perform a boundary check on the variables of the loaded netCDF file
     - existence_check: perform existence checks on dimensions, variables and global attributes
     - file_size_check: perform a file size check on the loaded netCDF file
@@ -45,6 +47,8 @@ class QualityControl:
       in the NetCDF file.
     - expected_dimensions_check: Method dedicated to checking whether each variable has the expected dimensions
     - perform_all_checks: Method that performs all checks
+    - _get_variable_values: Method to get the values of a variable of the loaded netCDF file,
+      read only once during perform_all_checks
     - create_report: Method to create and get a report from the logger
     """
 
@@ -58,6 +62,7 @@ class QualityControl:
         self.qc_check_file_size: dict = {}
         self.nc = None
         self.logger = LoggerQC()
+        self._data_cache: Optional[dict] = None
 
     def add_qc_checks_conf(self, path_qc_checks_file: Path):
         """
@@ -69,28 +74,28 @@ class QualityControl:
         self.add_qc_checks_dict(dict_qc_checks=new_checks_dict)
         return self
 
-    def add_qc_checks_dict(self, dict_qc_checks: dict):
+    def add_qc_checks_dict(self, dict_qc_checks: Mapping):
         """
         Method dedicated to adding quality control checks via a provided dictionary
-        :param dict_qc_checks: the dictionary containing the checks
+        :param dict_qc_checks: the dictionary (or other mapping) containing the checks
         :return: self
         """
-        if 'dimensions' not in list(dict_qc_checks.keys()):
+        if 'dimensions' not in dict_qc_checks:
             self.logger.add_error(error="missing dimensions checks in provided config_file/dict")
         else:
             new_checks_dims_dict = dict_qc_checks['dimensions']
             self.qc_checks_dims.update(new_checks_dims_dict)
-        if 'variables' not in list(dict_qc_checks.keys()):
+        if 'variables' not in dict_qc_checks:
             self.logger.add_error(error="missing variables checks in provided config_file/dict")
         else:
             new_checks_vars_dict = dict_qc_checks['variables']
             self.qc_checks_vars.update(new_checks_vars_dict)
-        if 'global attributes' not in list(dict_qc_checks.keys()):
+        if 'global attributes' not in dict_qc_checks:
             self.logger.add_error(error="missing global attributes checks in provided config_file/dict")
         else:
             new_checks_gl_attrs_dict = dict_qc_checks['global attributes']
             self.qc_checks_gl_attrs.update(new_checks_gl_attrs_dict)
-        if 'file size' not in list(dict_qc_checks.keys()):
+        if 'file size' not in dict_qc_checks:
             self.logger.add_error(error="missing file size check in provided config_file/dict")
         else:
             new_check_file_size = dict_qc_checks['file size']
@@ -111,10 +116,10 @@ class QualityControl:
         self.add_qc_checks_dict(dict_qc_checks=new_checks_dict)
         return self
 
-    def replace_qc_checks_dict(self, dict_qc_checks: dict):
+    def replace_qc_checks_dict(self, dict_qc_checks: Mapping):
         """
         Method dedicated to replacing the current checks with the ones from a provided dictionary
-        :param dict_qc_checks: the dictionary containing the checks
+        :param dict_qc_checks: the dictionary (or other mapping) containing the checks
         :return: self
         """
         self.qc_checks_dims = {}
@@ -124,15 +129,25 @@ class QualityControl:
         self.add_qc_checks_dict(dict_qc_checks=dict_qc_checks)
         return self
 
-    def load_netcdf(self, nc_file_path: Path):
+    def load_netcdf(self, nc_file_path: Union[str, Path]):
         """
         Method dedicated to loading a netCDF file to be checked with quality control
-        :param nc_file_path: path to the netCDF file
+        :param nc_file_path: path to the netCDF file, either as a string or as a Path
         :return: self
         """
         self.nc = netCDF4.Dataset(nc_file_path)  # pylint: disable=no-member
         return self
 
+    def load_netcdf_from_handle(self, nc_dataset: netCDF4.Dataset):  # pylint: disable=no-member
+        """
+        Method dedicated to loading an already opened netCDF dataset to be checked with quality control.
+        The dataset is not closed by the QualityControl object.
+        :param nc_dataset: the opened netCDF dataset
+        :return: self
+        """
+        self.nc = nc_dataset
+        return self
+
     def data_boundaries_check(self, all_checks_run: bool = False):
         """
         Method dedicated to checking whether the data for each variable in
@@ -171,7 +186,7 @@ class QualityControl:
             upper_bound = self.qc_checks_vars[var_name]['data_boundaries_check']['upper_bound']
 
             # use np.ravel to flatten the (possibly multidimensional) array into a 1-d array
-            var_values = np.ravel(self.nc[var_name][:])
+            var_values = np.ravel(self._get_variable_values(var_name))
 
             success = True
             for val in var_values:
@@ -302,7 +317,7 @@ class QualityControl:
                 continue
 
             checked_vars += 1
-            var_data = self.nc[var][:]
+            var_data = self._get_variable_values(var)
 
             checked_vals = 0
             empty_vals = 0
@@ -428,7 +443,7 @@ class QualityControl:
                 continue
 
             minimum = self.qc_checks_vars[var_name]['data_points_amount_check']['minimum']
-            var_values_size = self.nc[var_name][:].size  # total number of data points over all dimensions
+            var_values_size = self.nc[var_name].size  # total number of data points over all dimensions
 
             if minimum > var_values_size:
                 self.logger.add_error(f"data points amount check error: number of data points ({var_values_size})"
@@ -479,7 +494,7 @@ class QualityControl:
                 continue
 
             # gets all values of the variable
-            var_values = self.nc[var_name][:]
+            var_values = self._get_variable_values(var_name)
 
             # gets the specified dimensions
             dimensions = self.qc_checks_vars[var_name]['adjacent_values_difference_check'][
@@ -504,10 +519,12 @@ class QualityControl:
 
             for d in dimensions:
                 success = True
-                # calculates the difference between 2 adjacent values
+                # calculates the absolute difference between 2 adjacent values
                 difference_array = np.diff(var_values, axis=d)
+                # takes the absolute value in place, np.diff already returned a new array
+                np.abs(difference_array, out=difference_array)
                 # flattens the array
-                flat_difference_array = difference_array.flatten()
+                flat_difference_array = difference_array.ravel()
 
                 try:
                     # gets the maximum difference for each dimension
@@ -518,13 +535,14 @@ class QualityControl:
                     self.logger.add_warning(f"maximum difference not specified for dimension {d}")
                     continue
 
-                # goes through flattened array of adjacent differences
-                for i in flat_difference_array:
-                    difference = abs(i)
-                    if difference > maximum_difference:
-                        success = False
-                        self.logger.add_error(
-                            f"difference of '{difference}' exceeds the maximum difference of '{maximum_difference}'")
+                # selects the differences exceeding the maximum, masked values never exceed it
+                exceeds_maximum = np.ma.filled(flat_difference_array > maximum_difference, False)
+                exceeding_differences = np.ma.getdata(flat_difference_array)[exceeds_maximum]
+                if exceeding_differences.size:
+                    success = False
+                for difference in exceeding_differences:
+                    self.logger.add_error(
+                        f"difference of '{difference}' exceeds the maximum difference of '{maximum_difference}'")
 
                 self.logger.add_info(f"adjacent_values_difference_check for variable "
                                      f"'{var_name}' and dimension '{d}': {'SUCCESS' if success else 'FAIL'}")
@@ -566,7 +584,7 @@ class QualityControl:
                     self.logger.add_warning(f"variable '{var_name}' not in nc file")
                 continue
 
-            var_values = self.nc[var_name][:]
+            var_values = self._get_variable_values(var_name)
 
             # get the maximum from configuration file
             maximum = self.qc_checks_vars[var_name]['consecutive_identical_values_check']['maximum']
@@ -660,18 +678,37 @@ class QualityControl:
             if var_name not in vars_nc_file:
                 self.logger.add_warning(f"variable '{var_name}' not in nc file")
 
-        (self
-         .file_size_check()
-         .existence_check()
-         .emptiness_check(all_checks_run=True)
-         .data_points_amount_check(all_checks_run=True)
-         .data_boundaries_check(all_checks_run=True)
-         .consecutive_identical_values_check(all_checks_run=True)
-         .adjacent_values_difference_check(all_checks_run=True)
-         )
+        # the values of each variable are read once for all checks and freed after the last check
+        self._data_cache = {}
+        try:
+            (self
+             .file_size_check()
+             .existence_check()
+             .emptiness_check(all_checks_run=True)
+             .data_points_amount_check(all_checks_run=True)
+             .data_boundaries_check(all_checks_run=True)
+             .consecutive_identical_values_check(all_checks_run=True)
+             .adjacent_values_difference_check(all_checks_run=True)
+             )
+        finally:
+            self._data_cache = None
 
         return self
 
+    def _get_variable_values(self, var_name: str) -> np.ndarray:
+        """
+        Method to get the values of a variable of the loaded netCDF file. During perform_all_checks the
+        values are read from the file the first time and kept for the checks that follow, which must not
+        modify them. Outside of it the values are read every time, so they are not kept in memory.
+        :param var_name: name of the variable
+        :return: the values of the variable
+        """
+        if self._data_cache is None:
+            return self.nc[var_name][:]
+        if var_name not in self._data_cache:
+            self._data_cache[var_name] = self.nc[var_name][:]
+        return self._data_cache[var_name]
+
     def create_report(self, get_all_reports: bool = False) -> Union[list[dict], dict]:
         """
         Method to create and get a report from the logger
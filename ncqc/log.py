@@ -19,6 +19,8 @@ class LoggerQC:
     - add_error: method to add an error
     - add_warning: method to add info
     - add_info: method to add a message
+    - clear: method to clear the logged errors, warnings, and info
+    - snapshot: method to get the logged info, errors, and warnings as tuples
     - create_report: method to create a report
     - get_latest_report: method to get the latest report
     - get_all_reports: method to get all reports
@@ -54,6 +56,25 @@ class LoggerQC:
         """
         self.info.append(msg)
 
+    def clear(self):
+        """
+        Method dedicated to clearing the logged errors, warnings, and info of the report being made
+
+        - the method does not remove any of the already created reports
+        """
+        self.errors = []
+        self.warnings = []
+        self.info = []
+
+    def snapshot(self) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+        """
+        Method dedicated to getting the logged info, errors, and warnings of the report being made
+
+        - the returned tuples are copies, so logging afterwards does not change them
+        :return: a tuple with the logged info, errors, and warnings, each as a tuple
+        """
+        return tuple(self.info), tuple(self.errors), tuple(self.warnings)
+
     def create_report(self):
         """
         Method dedicated to creating a report and adding it to the list of reports
@@ -69,9 +90,7 @@ class LoggerQC:
             'info': self.info
         }
         self.reports.append(report_dict)
-        self.errors = []
-        self.warnings = []
-        self.info = []
+        self.clear()
 
     def get_latest_report(self) -> dict:
         """
@@ -17,6 +17,8 @@ class TestLoggerQC(unittest.TestCase):
     - test_add_error: Test for the add_error method
     - test_add_warning: Test for the add_warning method
     - test_add_info: Test for the add_info method
+    - test_clear: Test for the clear method
+    - test_snapshot: Test for the snapshot method
     - test_create_report: Test for the create_report method with a single report creation
     - test_create_report_mult_reports: Test for the create_report method with 2 report creations
     - test_get_latest_report_empty: Test for the get_latest_report method with no existing reports
@@ -71,6 +73,33 @@ class TestLoggerQC(unittest.TestCase):
         logger_obj.add_info("example message 2")
         assert logger_obj.info == ['example message', 'example message 2']
 
+    def test_clear(self):
+        """
+        Test for the clear method
+        """
+        logger_obj = LoggerQC()
+        logger_obj.reports = [{'test_report_1': 1}]
+        logger_obj.add_error("example error")
+        logger_obj.add_warning("example warning")
+        logger_obj.add_info("example message")
+        logger_obj.clear()
+        assert not logger_obj.errors
+        assert not logger_obj.warnings
+        assert not logger_obj.info
+        assert logger_obj.reports == [{'test_report_1': 1}]
+
+    def test_snapshot(self):
+        """
+        Test for the snapshot method
+        """
+        logger_obj = LoggerQC()
+        logger_obj.add_error("example error")
+        logger_obj.add_warning("example warning")
+        logger_obj.add_info("example message")
+        snapshot = logger_obj.snapshot()
+        logger_obj.add_info("another example message")
+        assert snapshot == (("example message",), ("example error",), ("example warning",))
+
     @patch('ncqc.log.date')
     @patch('ncqc.log.datetime')
     def test_create_report(self, mock_datetime, mock_date):
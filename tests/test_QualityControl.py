@@ -2,16 +2,51 @@
 Test module for the Quality Control object
 
  Functions:
+- create_mock_dataset: Creates a mock netCDF dataset with a single variable
 - test_yaml2dict: Test for the yaml2dict function
 """
 
 import unittest
 from pathlib import Path
-from unittest.mock import patch, Mock
+from typing import Tuple
+from unittest.mock import patch, Mock, MagicMock
+
+import numpy as np
 
 from ncqc.QCnetCDF import QualityControl, yaml2dict
 
 data_dir = Path(__file__).parent.parent / 'sample_data'
+example_config_path = data_dir / 'example_config.yaml'
+
+all_variable_checks_dict = {
+    'dimensions': {},
+    'global attributes': {},
+    'file size': {},
+    'variables': {
+        'example_variable': {
+            'emptiness_check': True,
+            'data_points_amount_check': {'minimum': 1},
+            'data_boundaries_check': {'lower_bound': 0, 'upper_bound': 10},
+            'consecutive_identical_values_check': {'maximum': 3},
+            'adjacent_values_difference_check': {'over_which_dimension': [0], 'maximum_difference': [2]}
+        }
+    }
+}
+
+
+def create_mock_dataset(values: list) -> Tuple[MagicMock, MagicMock]:
+    """
+    Creates a mock netCDF dataset with a single variable, example_variable
+    :param values: the values of the variable
+    :return: the mock dataset and the mock variable, which records how often its values are read
+    """
+    nc_variable = MagicMock()
+    nc_variable.__getitem__.return_value = np.array(values, dtype='f4')
+    nc_variable.size = len(values)
+    nc_dataset = MagicMock()
+    nc_dataset.variables = {'example_variable': nc_variable}
+    nc_dataset.__getitem__.side_effect = nc_dataset.variables.__getitem__
+    return nc_dataset, nc_variable
 
 
 class TestQualityControl(unittest.TestCase):
@@ -25,6 +60,9 @@ class TestQualityControl(unittest.TestCase):
     - test_replace_qc_checks_conf: Test for replacing the required checks by using a config file
     - test_replace_qc_checks_dict: Test for replacing the required checks by using a dictionary
     - test_load_netcdf: Test for using load_netcdf to set the netCDF attribute
+    - test_load_netcdf_from_handle: Test for using load_netcdf_from_handle to set the netCDF attribute
+    - test_perform_all_checks_reads_variables_once: Test that perform_all_checks reads each variable once
+    - test_perform_all_checks_after_setting_nc: Test that perform_all_checks checks a newly set netCDF file
     - test_yaml2dict: Test for loading a yaml file into a dictionary
     """
 
@@ -291,6 +329,56 @@ class TestQualityControl(unittest.TestCase):
         qc_obj.load_netcdf('path')
         mock_dataset.assert_called_once_with('path')
 
+    @patch('ncqc.QCnetCDF.netCDF4.Dataset')
+    def test_load_netcdf_from_handle(self, mock_dataset):
+        """
+        Test for using load_netcdf_from_handle to set the netCDF attribute
+        :param mock_dataset: mock object for the Dataset function
+        """
+        nc_dataset = Mock()
+        qc_obj = QualityControl()
+        assert qc_obj.load_netcdf_from_handle(nc_dataset) is qc_obj
+        assert qc_obj.nc is nc_dataset
+        mock_dataset.assert_not_called()
+
+    def test_perform_all_checks_reads_variables_once(self):
+        """
+        Test that perform_all_checks reads each variable from the netCDF file once for all checks,
+        and that a check run by itself afterwards reads the variable again
+        """
+        nc_dataset, nc_variable = create_mock_dataset([1, 2, 3, 4, 5])
+        qc_obj = QualityControl()
+        qc_obj.load_netcdf_from_handle(nc_dataset)
+        qc_obj.add_qc_checks_dict(all_variable_checks_dict)
+
+        qc_obj.perform_all_checks()
+        nc_variable.__getitem__.assert_called_once()
+        assert not qc_obj.logger.errors
+
+        qc_obj.data_boundaries_check()
+        assert nc_variable.__getitem__.call_count == 2
+
+    def test_perform_all_checks_after_setting_nc(self):
+        """
+        Test that after setting the nc attribute directly, perform_all_checks checks the values of
+        the new netCDF file instead of those of the previous one
+        """
+        first_dataset, _ = create_mock_dataset([1, 2, 3, 4, 5])
+        second_dataset, second_variable = create_mock_dataset([1, 2, 30, 4, 5])
+        qc_obj = QualityControl()
+        qc_obj.add_qc_checks_dict(all_variable_checks_dict)
+        qc_obj.nc = first_dataset
+        qc_obj.perform_all_checks()
+        assert not qc_obj.logger.errors
+
+        qc_obj.nc = second_dataset
+        qc_obj.perform_all_checks()
+
+        second_variable.__getitem__.assert_called_once()
+        assert "boundary check for variable 'example_variable': FAIL" in qc_obj.logger.info
+        assert "adjacent_values_difference_check for variable 'example_variable' and dimension '0': FAIL" \
+            in qc_obj.logger.info
+
     @patch('ncqc.log.date')
     @patch('ncqc.log.datetime')
     @patch('ncqc.QCnetCDF.Path.stat', return_value=Mock(st_size=15000))
@@ -310,7 +398,7 @@ class TestQualityControl(unittest.TestCase):
         mock_datetime.now.return_value = mock_datetime_now
 
         qc_obj = QualityControl()
-        qc_obj.add_qc_checks_conf(data_dir / 'example_config.yaml')
+        qc_obj.add_qc_checks_conf(example_config_path)
         mock_nc = Mock()
         mock_nc.filepath.return_value = 'dummy/path'
         qc_obj.nc = mock_nc
@@ -351,7 +439,7 @@ def test_yaml2dict():
     """
     Test for the yaml2dict function
     """
-    res = yaml2dict(Path(__file__).parent.parent / 'sample_data/example_config.yaml')
+    res = yaml2dict(example_config_path)
     assert res == {
         'dimensions': {'example_dimension': {'existence_check': True}},
         'variables': {
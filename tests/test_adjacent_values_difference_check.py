@@ -2,14 +2,17 @@
 Module for testing the functionality of the value_change_rate_check method
 
  Functions:
+- _build_checks_dict: Builds a checks dictionary, read-only at the top level, from general_dict and the given variables
+- fixture_loaded_qc_obj (fixture loaded_qc_obj): Module scoped fixture with a QualityControl object
+  that has the netCDF file loaded
+- fixture_nc_handle (fixture nc_handle): Module scoped fixture with the opened netCDF dataset
+  with multiple dimensions
 - test_adjacent_values_difference_check_no_nc: Test for
   adjacent_values_difference_check when no netCDF file is loaded.
-- test_adjacent_values_difference_check_success: Test for when
-  adjacent_values_difference_check succeeds.
-- test_adjacent_values_difference_check_fail: Test for when
-  adjacent_values_difference_check fails.
-- test_adjacent_values_difference_check_var_not_in_file: Test
-  adjacent_values_difference_check when variable is not in file.
+- test_adjacent_values_difference_check: Parametrized test for when adjacent_values_difference_check
+  succeeds, when it fails, and when a variable is not in the file.
+- test_adjacent_values_difference_check_changed_data: Test that the current values of the loaded netCDF
+  dataset are checked when data is appended or overwritten between two checks.
 - test_adjacent_values_difference_check_dimensions_not_specified:
   Test adjacent_values_difference_check when dimensions are not specified.
 - test_adjacent_values_difference_check_maximum_difference_not_specified:
@@ -21,14 +24,14 @@ Module for testing the functionality of the value_change_rate_check method
 
 """
 
-import os
-from pathlib import Path
+from types import MappingProxyType
+from typing import Iterator
+
+import netCDF4
 import pytest
 
 from ncqc.QCnetCDF import QualityControl
 
-data_dir = Path(__file__).parent.parent / 'sample_data'
-
 general_dict = {
     'dimensions': {
     },
@@ -38,269 +41,245 @@ general_dict = {
     }
 }
 
-adjacent_values_difference_check_dict_success = {
-    'variables': {
-        'test_pass': {
-            'adjacent_values_difference_check': {'over_which_dimension': [0], 'maximum_difference': [1]}
-        },
-    }
-}
 
-adjacent_values_difference_check_dict_fail = {
-    'variables': {
-        'test_fail': {
-            'adjacent_values_difference_check': {'over_which_dimension': [0], 'maximum_difference': [1]}
-        },
-    }
-}
+def _build_checks_dict(variables: dict) -> MappingProxyType:
+    """
+    Builds a checks dictionary from general_dict and the given variables, wrapped in a read-only proxy.
+    The dictionaries are shared by the tests. The proxy only protects the top level: the section
+    dictionaries inside it, such as 'variables', are still mutable and must not be changed by a test.
+    :param variables: checks for the variables
+    :return: the checks dictionary, read-only at the top level
+    """
+    return MappingProxyType({**general_dict, 'variables': variables})
 
-adjacent_values_difference_check_var_not_in_nc_dict = {
-    'variables': {
-        'test_not_in_nc': {
-            'adjacent_values_difference_check': {'over_which_dimension': [0], 'maximum_difference': [1]}
-        },
-    }
-}
 
-adjacent_values_difference_check_dimensions_not_specified_dict = {
-    'variables': {
-        'test_pass': {
-            'adjacent_values_difference_check': {'over_which_dimension':'', 'maximum_difference': 1}
-        },
-    }
-}
+adjacent_values_difference_check_dict_success = _build_checks_dict({
+    'test_pass': {'adjacent_values_difference_check': {'over_which_dimension': [0], 'maximum_difference': [1]}},
+})
 
-adjacent_values_difference_check_max_difference_not_specified_dict = {
-    'variables': {
-        'test_pass': {
-            'adjacent_values_difference_check': {'over_which_dimension': [0], 'maximum_difference': ''}
-        },
-    }
-}
+adjacent_values_difference_check_dict_fail = _build_checks_dict({
+    'test_fail': {'adjacent_values_difference_check': {'over_which_dimension': [0], 'maximum_difference': [1]}},
+})
 
-adjacent_values_difference_check_wrong_number_of_dimensions_dict = {
-    'variables': {
-        'test_pass': {
-            'adjacent_values_difference_check': {'over_which_dimension': [0,1], 'maximum_difference': [1]}
-        },
-    }
-}
+adjacent_values_difference_check_var_not_in_nc_dict = _build_checks_dict({
+    'test_not_in_nc': {'adjacent_values_difference_check': {'over_which_dimension': [0], 'maximum_difference': [1]}},
+})
 
-adjacent_values_difference_check_multidim_dict = {
-    'variables': {
-        'var_2d': {
-            'adjacent_values_difference_check': {'over_which_dimension': [0,1], 'maximum_difference': [1,1]}
-        },
-    }
-}
+adjacent_values_difference_check_dimensions_not_specified_dict = _build_checks_dict({
+    'test_pass': {'adjacent_values_difference_check': {'over_which_dimension':'', 'maximum_difference': 1}},
+})
 
-adjacent_values_difference_check_max_difference_not_specified_multidim_dict = {
-    'variables': {
-        'var_2d': {
-            'adjacent_values_difference_check': {'over_which_dimension': [0,1], 'maximum_difference': [1]}
-        },
-    }
-}
+adjacent_values_difference_check_max_difference_not_specified_dict = _build_checks_dict({
+    'test_pass': {'adjacent_values_difference_check': {'over_which_dimension': [0], 'maximum_difference': ''}},
+})
 
+adjacent_values_difference_check_wrong_number_of_dimensions_dict = _build_checks_dict({
+    'test_pass': {'adjacent_values_difference_check': {'over_which_dimension': [0,1], 'maximum_difference': [1]}},
+})
 
-def test_adjacent_values_difference_check_no_nc():
+adjacent_values_difference_check_multidim_dict = _build_checks_dict({
+    'var_2d': {'adjacent_values_difference_check': {'over_which_dimension': [0,1], 'maximum_difference': [1,1]}},
+})
+
+adjacent_values_difference_check_max_difference_not_specified_multidim_dict = _build_checks_dict({
+    'var_2d': {'adjacent_values_difference_check': {'over_which_dimension': [0,1], 'maximum_difference': [1]}},
+})
+
+
+_EXPECTED_INFO_SUCCESS = ("adjacent_values_difference_check for variable 'test_pass' and dimension '0': SUCCESS",)
+_EXPECTED_INFO_FAIL = ("adjacent_values_difference_check for variable 'test_fail' and dimension '0': FAIL",)
+_EXPECTED_INFO_MULTIDIM = ("adjacent_values_difference_check for variable 'var_2d' and dimension '0': SUCCESS",
+                           "adjacent_values_difference_check for variable 'var_2d' and dimension '1': SUCCESS")
+_EXPECTED_INFO_MULTIDIM_DIM_0 = _EXPECTED_INFO_MULTIDIM[:1]
+
+
+@pytest.fixture(scope="module", name="loaded_qc_obj")
+def fixture_loaded_qc_obj(load_qc_obj, create_nc_adjacent_values_difference_check) -> QualityControl:
     """
-    Test for adjacent_values_difference_check when no netCDF file is loaded.
+    QualityControl object with the netCDF file for testing adjacent_values_difference_check loaded,
+    shared by the tests in this module.
+    :param load_qc_obj: function loading a netCDF file into a QualityControl object
+    :param create_nc_adjacent_values_difference_check: path to the netCDF file created by the test fixture
+    :return: the QualityControl object
     """
-    qc_obj = QualityControl()
+    return load_qc_obj(create_nc_adjacent_values_difference_check)
 
-    dictionary = general_dict | adjacent_values_difference_check_dict_success
-    qc_obj.add_qc_checks_dict(dictionary)
-    qc_obj.adjacent_values_difference_check()
 
-    assert not qc_obj.logger.info
-    assert qc_obj.logger.errors == ['adjacent_values_difference_check error: no nc file loaded']
-    assert not qc_obj.logger.warnings
+@pytest.fixture(scope="module", name="nc_handle")
+def fixture_nc_handle(
+        create_nc_adjacent_values_difference_check_multidim) -> Iterator[netCDF4.Dataset]:  # pylint: disable=no-member
+    """
+    Opened netCDF dataset for testing adjacent_values_difference_check with multiple dimensions.
+    The dataset is opened once for the tests in this module and closed after the last one.
+    :param create_nc_adjacent_values_difference_check_multidim: path to the netCDF file created by the test fixture
+    :return: iterator yielding the opened netCDF dataset
+    """
+    nc_dataset = netCDF4.Dataset(create_nc_adjacent_values_difference_check_multidim, 'r')  # pylint: disable=no-member
+    yield nc_dataset
+    nc_dataset.close()
 
 
-@pytest.mark.usefixtures("create_nc_adjacent_values_difference_check")
-def test_adjacent_values_difference_check_success():
+def test_adjacent_values_difference_check_no_nc():
     """
-    Test for when adjacent_values_difference_check succeeds.
+    Test for adjacent_values_difference_check when no netCDF file is loaded.
     """
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_adjacent_values_difference_check.nc'
-    qc_obj.load_netcdf(nc_path)
-
-    dictionary = general_dict | adjacent_values_difference_check_dict_success
+    dictionary = adjacent_values_difference_check_dict_success
     qc_obj.add_qc_checks_dict(dictionary)
-
     qc_obj.adjacent_values_difference_check()
 
-    assert qc_obj.logger.info == ["adjacent_values_difference_check for variable 'test_pass'"
-                                  " and dimension '0': SUCCESS"]
-    assert not qc_obj.logger.errors
-    assert not qc_obj.logger.warnings
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
-
-@pytest.mark.usefixtures("create_nc_adjacent_values_difference_check")
-def test_adjacent_values_difference_check_fail():
+    assert qc_obj.logger.snapshot() == ((), ('adjacent_values_difference_check error: no nc file loaded',), ())
+
+
+@pytest.mark.parametrize("checks_dict,expected_info,expected_error_count,expected_warnings", [
+    (adjacent_values_difference_check_dict_success,
+     _EXPECTED_INFO_SUCCESS,
+     0,
+     ()),
+    (adjacent_values_difference_check_dict_fail,
+     _EXPECTED_INFO_FAIL,
+     19,
+     ()),
+    (adjacent_values_difference_check_var_not_in_nc_dict,
+     (),
+     0,
+     ("variable 'test_not_in_nc' not in nc file",)),
+], ids=['success', 'fail', 'var_not_in_file'])
+def test_adjacent_values_difference_check(loaded_qc_obj, checks_dict, expected_info,
+                                          expected_error_count, expected_warnings):
     """
-    Test for when adjacent_values_difference_check fails.
+    Test for when adjacent_values_difference_check succeeds, when it fails, and when a variable
+    to be checked is not in the file.
+    :param loaded_qc_obj: QualityControl object with the netCDF file loaded, shared by the tests in this module
+    :param checks_dict: the checks to add to the QualityControl object
+    :param expected_info: the info messages the logger should contain after the check
+    :param expected_error_count: the number of errors the logger should contain after the check
+    :param expected_warnings: the warnings the logger should contain after the check
     """
-    qc_obj = QualityControl()
+    qc_obj = loaded_qc_obj
+    qc_obj.logger.clear()
 
-    nc_path = data_dir / 'test_adjacent_values_difference_check.nc'
-    qc_obj.load_netcdf(nc_path)
-
-    dictionary = general_dict | adjacent_values_difference_check_dict_fail
-    qc_obj.add_qc_checks_dict(dictionary)
+    qc_obj.replace_qc_checks_dict(checks_dict)
 
     qc_obj.adjacent_values_difference_check()
 
-    assert qc_obj.logger.info == ["adjacent_values_difference_check for variable 'test_fail' and "
-                                  "dimension '0': FAIL"]
-    assert len(qc_obj.logger.errors) == 19
-    assert not qc_obj.logger.warnings
+    assert tuple(qc_obj.logger.info) == expected_info
+    assert len(qc_obj.logger.errors) == expected_error_count
+    assert tuple(qc_obj.logger.warnings) == expected_warnings
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
 
-
-@pytest.mark.usefixtures("create_nc_adjacent_values_difference_check")
-def test_adjacent_values_difference_check_var_not_in_file():
+def test_adjacent_values_difference_check_changed_data():
     """
-    Test adjacent_values_difference_check when variable is not in file.
+    Test that adjacent_values_difference_check checks the current values of the loaded netCDF dataset,
+    when data is appended to or overwritten in the dataset between two checks.
     """
     qc_obj = QualityControl()
+    qc_obj.add_qc_checks_dict(adjacent_values_difference_check_dict_success)
 
-    nc_path = data_dir / 'test_adjacent_values_difference_check.nc'
-    qc_obj.load_netcdf(nc_path)
+    with netCDF4.Dataset('changed.nc', 'w', diskless=True) as nc_dataset:  # pylint: disable=no-member
+        nc_dataset.createDimension('time', None)
+        test_pass = nc_dataset.createVariable('test_pass', 'f4', ('time',))
+        test_pass[:] = [0, 0, 0]
+        qc_obj.load_netcdf_from_handle(nc_dataset)
 
-    dictionary = general_dict | adjacent_values_difference_check_var_not_in_nc_dict
-    qc_obj.add_qc_checks_dict(dictionary)
+        qc_obj.adjacent_values_difference_check()
+        assert qc_obj.logger.snapshot() == (_EXPECTED_INFO_SUCCESS, (), ())
 
-    qc_obj.adjacent_values_difference_check()
+        qc_obj.logger.clear()
+        test_pass[3:5] = [500, 0]
+        qc_obj.adjacent_values_difference_check()
+        assert qc_obj.logger.snapshot() == (
+            ("adjacent_values_difference_check for variable 'test_pass' and dimension '0': FAIL",),
+            ("difference of '500.0' exceeds the maximum difference of '1'",) * 2,
+            ())
 
-    assert not qc_obj.logger.info
-    assert not qc_obj.logger.errors
-    assert qc_obj.logger.warnings == ['variable \'test_not_in_nc\' not in nc file']
+        qc_obj.logger.clear()
+        test_pass[:] = [0, 0, 0, 0, 0]
+        qc_obj.adjacent_values_difference_check()
+        assert qc_obj.logger.snapshot() == (_EXPECTED_INFO_SUCCESS, (), ())
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
 
-@pytest.mark.usefixtures("create_nc_adjacent_values_difference_check")
-def test_adjacent_values_difference_check_dimensions_not_specified():
+def test_adjacent_values_difference_check_dimensions_not_specified(loaded_qc_obj):
     """
     Test adjacent_values_difference_check when dimensions are not specified.
+    :param loaded_qc_obj: QualityControl object with the netCDF file loaded, shared by the tests in this module
     """
 
-    qc_obj = QualityControl()
-
-    nc_path = data_dir / 'test_adjacent_values_difference_check.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj = loaded_qc_obj
+    qc_obj.logger.clear()
 
-    dictionary = general_dict | adjacent_values_difference_check_dimensions_not_specified_dict
-    qc_obj.add_qc_checks_dict(dictionary)
+    dictionary = adjacent_values_difference_check_dimensions_not_specified_dict
+    qc_obj.replace_qc_checks_dict(dictionary)
 
     qc_obj.adjacent_values_difference_check()
 
-    assert not qc_obj.logger.info
-    assert not qc_obj.logger.errors
-    assert qc_obj.logger.warnings == ["dimension/s to check not specified"]
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
+    assert qc_obj.logger.snapshot() == ((), (), ("dimension/s to check not specified",))
 
-@pytest.mark.usefixtures("create_nc_adjacent_values_difference_check")
-def test_adjacent_values_difference_check_maximum_difference_not_specified():
+def test_adjacent_values_difference_check_maximum_difference_not_specified(loaded_qc_obj):
     """
     Test adjacent_values_difference_check when maximum difference is not specified.
+    :param loaded_qc_obj: QualityControl object with the netCDF file loaded, shared by the tests in this module
     """
 
-    qc_obj = QualityControl()
-
-    nc_path = data_dir / 'test_adjacent_values_difference_check.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj = loaded_qc_obj
+    qc_obj.logger.clear()
 
-    dictionary = general_dict | adjacent_values_difference_check_max_difference_not_specified_dict
-    qc_obj.add_qc_checks_dict(dictionary)
+    dictionary = adjacent_values_difference_check_max_difference_not_specified_dict
+    qc_obj.replace_qc_checks_dict(dictionary)
 
     qc_obj.adjacent_values_difference_check()
 
-    assert not qc_obj.logger.info
-    assert not qc_obj.logger.errors
-    assert qc_obj.logger.warnings == ["maximum difference/s to check not specified"]
+    assert qc_obj.logger.snapshot() == ((), (), ("maximum difference/s to check not specified",))
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
-@pytest.mark.usefixtures("create_nc_adjacent_values_difference_check")
-def test_adjacent_values_difference_check_wrong_number_of_dimensions():
+def test_adjacent_values_difference_check_wrong_number_of_dimensions(loaded_qc_obj):
     """
     Test adjacent_values_difference_check when too many/too few dimensions are specified.
+    :param loaded_qc_obj: QualityControl object with the netCDF file loaded, shared by the tests in this module
     """
 
-    qc_obj = QualityControl()
-
-    nc_path = data_dir / 'test_adjacent_values_difference_check.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj = loaded_qc_obj
+    qc_obj.logger.clear()
 
-    dictionary = general_dict | adjacent_values_difference_check_wrong_number_of_dimensions_dict
-    qc_obj.add_qc_checks_dict(dictionary)
+    dictionary = adjacent_values_difference_check_wrong_number_of_dimensions_dict
+    qc_obj.replace_qc_checks_dict(dictionary)
 
     qc_obj.adjacent_values_difference_check()
 
-    assert not qc_obj.logger.info
-    assert not qc_obj.logger.errors
-    assert qc_obj.logger.warnings == ["variable test_pass doesn't have 2 dimensions"]
+    assert qc_obj.logger.snapshot() == ((), (), ("variable test_pass doesn't have 2 dimensions",))
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
-@pytest.mark.usefixtures("create_nc_adjacent_values_difference_check_multidim")
-def test_adjacent_values_difference_check_multidim():
+def test_adjacent_values_difference_check_multidim(nc_handle):
     """
     Test adjacent_values_difference_check when variable has multiple dimensions.
+    :param nc_handle: opened netCDF dataset, shared by the tests in this module
     """
 
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_adjacent_values_difference_check.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj.load_netcdf_from_handle(nc_handle)
 
-    dictionary = general_dict | adjacent_values_difference_check_multidim_dict
+    dictionary = adjacent_values_difference_check_multidim_dict
     qc_obj.add_qc_checks_dict(dictionary)
 
     qc_obj.adjacent_values_difference_check()
 
-    assert qc_obj.logger.info == ["adjacent_values_difference_check for variable 'var_2d' and dimension '0': SUCCESS",
-                                  "adjacent_values_difference_check for variable 'var_2d' and dimension '1': SUCCESS"]
-    assert not qc_obj.logger.errors
-    assert not qc_obj.logger.warnings
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
+    assert qc_obj.logger.snapshot() == (_EXPECTED_INFO_MULTIDIM, (), ())
 
-@pytest.mark.usefixtures("create_nc_adjacent_values_difference_check_multidim")
-def test_adjacent_values_difference_check_max_difference_not_specified_multidim():
+def test_adjacent_values_difference_check_max_difference_not_specified_multidim(nc_handle):
     """
     Test adjacent_values_difference_check when maximum difference is not specified for a
     certain dimension.
+    :param nc_handle: opened netCDF dataset, shared by the tests in this module
     """
 
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_adjacent_values_difference_check.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj.load_netcdf_from_handle(nc_handle)
 
-    dictionary = general_dict | adjacent_values_difference_check_max_difference_not_specified_multidim_dict
+    dictionary = adjacent_values_difference_check_max_difference_not_specified_multidim_dict
     qc_obj.add_qc_checks_dict(dictionary)
 
     qc_obj.adjacent_values_difference_check()
 
-    assert qc_obj.logger.info == ["adjacent_values_difference_check for variable 'var_2d' and dimension '0': SUCCESS"]
-    assert not qc_obj.logger.errors
-    assert qc_obj.logger.warnings == ["maximum difference not specified for dimension 1"]
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
+    assert qc_obj.logger.snapshot() == (_EXPECTED_INFO_MULTIDIM_DIM_0, (),
+                                        ("maximum difference not specified for dimension 1",))
@@ -2,26 +2,21 @@
 Module for testing the functionality of the consecutive_identical_values_check method
 
  Functions:
+- fixture_loaded_qc_obj (fixture loaded_qc_obj): Module scoped fixture with a QualityControl object
+  that has the netCDF file loaded
 - test_consecutive_identical_values_check_no_nc: Test for consecutive_identical_values_check
   when no netCDF file is loaded
-- test_consecutive_identical_values_check_success: Test for when there aren't to many consecutive same values
-- test_consecutive_identical_values_check_fail: Test for when a variable has to many consecutive same values
-- test_consecutive_identical_values_check_var_not_in_file: Test checking the max number of consecutive same values
-  of variables
-  when variable is not in file
+- test_consecutive_identical_values_check: Parametrized test for when there aren't to many consecutive same values,
+  when a variable has to many consecutive same values, and when a variable is not in the file
 - test_consecutive_identical_values_check_max_not_specified: Test for when maximum is not specified.
 - test_consecutive_identical_values_check_fewer_values_than_maximum: Tests for when array of values
   is smaller or equal to allowed maximum (check then allways succeeds).
 """
 
-import os
-from pathlib import Path
 import pytest
 
 from ncqc.QCnetCDF import QualityControl
 
-data_dir = Path(__file__).parent.parent / 'sample_data'
-
 general_dict = {
     'dimensions': {
     },
@@ -71,103 +66,82 @@ consecutive_identical_values_check_fewer_vals_than_max_dict = {
     }
 }
 
-def test_consecutive_identical_values_check_no_nc():
-    """
-    Test for consecutive_identical_values_check when no netCDF file is loaded.
-    """
-    qc_obj = QualityControl()
-
-    dictionary = general_dict | consecutive_identical_values_check_dict_success
-    qc_obj.add_qc_checks_dict(dictionary)
-    qc_obj.consecutive_identical_values_check()
-
-    assert not qc_obj.logger.info
-    assert qc_obj.logger.errors == ['consecutive_identical_values_check error: no nc file loaded']
-    assert not qc_obj.logger.warnings
-
 
-@pytest.mark.usefixtures("create_nc_consecutive_identical_values_check")
-def test_consecutive_identical_values_check_success():
+@pytest.fixture(scope="module", name="loaded_qc_obj")
+def fixture_loaded_qc_obj(load_qc_obj, create_nc_consecutive_identical_values_check) -> QualityControl:
     """
-    Test for when there aren't to many consecutive same values.
+    QualityControl object with the netCDF file for testing consecutive_identical_values_check loaded,
+    shared by the tests in this module.
+    :param load_qc_obj: function loading a netCDF file into a QualityControl object
+    :param create_nc_consecutive_identical_values_check: path to the netCDF file created by the test fixture
+    :return: the QualityControl object
     """
-    qc_obj = QualityControl()
-
-    nc_path = data_dir / 'test_consecutive_identical_values_check.nc'
-    qc_obj.load_netcdf(nc_path)
-
-    dictionary = general_dict | consecutive_identical_values_check_dict_success
-    qc_obj.add_qc_checks_dict(dictionary)
+    return load_qc_obj(create_nc_consecutive_identical_values_check)
 
-    qc_obj.consecutive_identical_values_check()
 
-    assert qc_obj.logger.info == ["consecutive_identical_values_check for variable 'test_pass': "
-                                  'SUCCESS']
-    assert not qc_obj.logger.errors
-    assert not qc_obj.logger.warnings
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
-
-@pytest.mark.usefixtures("create_nc_consecutive_identical_values_check")
-def test_consecutive_identical_values_check_fail():
+def test_consecutive_identical_values_check_no_nc():
     """
-    Test for when a variable has to many consecutive same values.
+    Test for consecutive_identical_values_check when no netCDF file is loaded.
     """
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_consecutive_identical_values_check.nc'
-    qc_obj.load_netcdf(nc_path)
-
-    dictionary = general_dict | consecutive_identical_values_check_dict_fail
+    dictionary = general_dict | consecutive_identical_values_check_dict_success
     qc_obj.add_qc_checks_dict(dictionary)
-
     qc_obj.consecutive_identical_values_check()
 
-    assert qc_obj.logger.info == ["consecutive_identical_values_check for variable 'test_fail': FAIL"]
-    assert qc_obj.logger.errors == [
-        "test_fail has 100 consecutive identical values 1.0, which is higher than the threshold of 50"]
+    assert not qc_obj.logger.info
+    assert qc_obj.logger.errors == ['consecutive_identical_values_check error: no nc file loaded']
     assert not qc_obj.logger.warnings
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
 
-@pytest.mark.usefixtures("create_nc_consecutive_identical_values_check")
-def test_consecutive_identical_values_check_var_not_in_file():
+@pytest.mark.parametrize("checks_dict,expected_info,expected_errors,expected_warnings", [
+    (consecutive_identical_values_check_dict_success,
+     ["consecutive_identical_values_check for variable 'test_pass': SUCCESS"],
+     [],
+     []),
+    (consecutive_identical_values_check_dict_fail,
+     ["consecutive_identical_values_check for variable 'test_fail': FAIL"],
+     ["test_fail has 100 consecutive identical values 1.0, which is higher than the threshold of 50"],
+     []),
+    (consecutive_identical_values_check_var_not_in_nc_dict,
+     [],
+     [],
+     ["variable 'test_not_in_nc' not in nc file"]),
+], ids=['success', 'fail', 'var_not_in_file'])
+def test_consecutive_identical_values_check(loaded_qc_obj, checks_dict, expected_info,
+                                            expected_errors, expected_warnings):
     """
-    Test checking the max number of consecutive same values of variables
-    when variable is not in file.
+    Test for when there aren't too many consecutive same values, when a variable has too many
+    consecutive same values, and when a variable to be checked is not in the file.
+    :param loaded_qc_obj: QualityControl object with the netCDF file loaded, shared by the tests in this module
+    :param checks_dict: the variables checks to add to the QualityControl object
+    :param expected_info: the info messages the logger should contain after the check
+    :param expected_errors: the errors the logger should contain after the check
+    :param expected_warnings: the warnings the logger should contain after the check
     """
-    qc_obj = QualityControl()
-
-    nc_path = data_dir / 'test_consecutive_identical_values_check.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj = loaded_qc_obj
+    qc_obj.logger.clear()
 
-    dictionary = general_dict | consecutive_identical_values_check_var_not_in_nc_dict
-    qc_obj.add_qc_checks_dict(dictionary)
+    dictionary = general_dict | checks_dict
+    qc_obj.replace_qc_checks_dict(dictionary)
 
     qc_obj.consecutive_identical_values_check()
 
-    assert not qc_obj.logger.errors
-    assert qc_obj.logger.warnings == ['variable \'test_not_in_nc\' not in nc file']
+    assert qc_obj.logger.info == expected_info
+    assert qc_obj.logger.errors == expected_errors
+    assert qc_obj.logger.warnings == expected_warnings
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
 
-@pytest.mark.usefixtures("create_nc_consecutive_identical_values_check")
-def test_consecutive_identical_values_check_max_not_specified():
+def test_consecutive_identical_values_check_max_not_specified(loaded_qc_obj):
     """
     Test for when maximum is not specified.
+    :param loaded_qc_obj: QualityControl object with the netCDF file loaded, shared by the tests in this module
     """
-    qc_obj = QualityControl()
-
-    nc_path = data_dir / 'test_consecutive_identical_values_check.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj = loaded_qc_obj
+    qc_obj.logger.clear()
 
     dictionary = general_dict | consecutive_identical_values_check_max_not_specified_dict
-    qc_obj.add_qc_checks_dict(dictionary)
+    qc_obj.replace_qc_checks_dict(dictionary)
 
     qc_obj.consecutive_identical_values_check()
 
@@ -175,21 +149,17 @@ def test_consecutive_identical_values_check_max_not_specified():
     assert not qc_obj.logger.errors
     assert qc_obj.logger.warnings == ["consecutive_identical_values_check: Maximum not specified"]
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
 
-@pytest.mark.usefixtures("create_nc_consecutive_identical_values_check")
-def test_consecutive_identical_values_check_fewer_values_than_maximum():
+def test_consecutive_identical_values_check_fewer_values_than_maximum(loaded_qc_obj):
     """
     Tests for when array of values is smaller or equal to allowed maximum (check then allways succeeds).
+    :param loaded_qc_obj: QualityControl object with the netCDF file loaded, shared by the tests in this module
     """
-    qc_obj = QualityControl()
-
-    nc_path = data_dir / 'test_consecutive_identical_values_check.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj = loaded_qc_obj
+    qc_obj.logger.clear()
 
     dictionary = general_dict | consecutive_identical_values_check_fewer_vals_than_max_dict
-    qc_obj.add_qc_checks_dict(dictionary)
+    qc_obj.replace_qc_checks_dict(dictionary)
 
     qc_obj.consecutive_identical_values_check()
 
@@ -197,6 +167,3 @@ def test_consecutive_identical_values_check_fewer_values_than_maximum():
                                   'SUCCESS']
     assert not qc_obj.logger.errors
     assert not qc_obj.logger.warnings
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
@@ -18,15 +18,9 @@ Module for testing the functionality of the boundaries check
   with expected failure
 """
 
-import os
-from pathlib import Path
 from hypothesis import given, strategies as st, settings
-import pytest
 
 from ncqc.QCnetCDF import QualityControl
-from conftest import create_nc_data_boundaries_check_property_based
-
-data_dir = Path(__file__).parent.parent / 'sample_data'
 
 data_boundaries_check_test_dict = {
     'dimensions': {
@@ -83,15 +77,14 @@ def test_data_boundaries_check_no_nc():
     assert not qc_obj.logger.warnings
 
 
-@pytest.mark.usefixtures("create_nc_data_boundaries_check_success")
-def test_data_boundaries_check_success():
+def test_data_boundaries_check_success(create_nc_data_boundaries_check_success):
     """
     Test for the boundaries check when all checks are successful
+    :param create_nc_data_boundaries_check_success: path to the netCDF file created by the test fixture
     """
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_boundary_success.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj.load_netcdf(create_nc_data_boundaries_check_success)
 
     qc_obj.add_qc_checks_dict(data_boundaries_check_test_dict)
 
@@ -102,19 +95,15 @@ def test_data_boundaries_check_success():
     assert not qc_obj.logger.errors
     assert not qc_obj.logger.warnings
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
 
-
-@pytest.mark.usefixtures("create_nc_data_boundaries_check_fail")
-def test_data_boundaries_check_fail():
+def test_data_boundaries_check_fail(create_nc_data_boundaries_check_fail):
     """
     Test for the boundaries check when a check fails
+    :param create_nc_data_boundaries_check_fail: path to the netCDF file created by the test fixture
     """
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_boundary_fail.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj.load_netcdf(create_nc_data_boundaries_check_fail)
 
     qc_obj.add_qc_checks_dict({
         'dimensions': {
@@ -147,19 +136,15 @@ def test_data_boundaries_check_fail():
                                     ' for variable'' \'kinetic_energy\' with bounds [0,1.8]']
     assert not qc_obj.logger.warnings
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
 
-
-@pytest.mark.usefixtures("create_nc_data_boundaries_check_success")
-def test_data_boundaries_check_wrong_var_name():
+def test_data_boundaries_check_wrong_var_name(create_nc_data_boundaries_check_success):
     """
     Test for the boundaries check when a variable to be checked is not in the loaded netCDF file
+    :param create_nc_data_boundaries_check_success: path to the netCDF file created by the test fixture
     """
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_boundary_success.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj.load_netcdf(create_nc_data_boundaries_check_success)
 
     qc_obj.add_qc_checks_dict(data_boundaries_check_test_dict)
 
@@ -182,19 +167,15 @@ def test_data_boundaries_check_wrong_var_name():
     assert not qc_obj.logger.errors
     assert qc_obj.logger.warnings == ['variable \'no_such_var\' not in nc file']
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
 
-
-@pytest.mark.usefixtures("create_nc_data_boundaries_check_success")
-def test_data_boundaries_check_omit_a_var():
+def test_data_boundaries_check_omit_a_var(create_nc_data_boundaries_check_success):
     """
     Test for the boundaries check when a variable has to be omitted
+    :param create_nc_data_boundaries_check_success: path to the netCDF file created by the test fixture
     """
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_boundary_success.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj.load_netcdf(create_nc_data_boundaries_check_success)
 
     data_boundaries_check_test_dict_omit_var = {
         'dimensions': {
@@ -225,22 +206,19 @@ def test_data_boundaries_check_omit_a_var():
     assert not qc_obj.logger.warnings
     assert not qc_obj.logger.errors
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
 
 @settings(deadline=None)
 @given(data=st.lists(st.integers(min_value=-10, max_value=40), max_size=100))
-def test_data_boundaries_check_property_based_success(data):
+def test_data_boundaries_check_property_based_success(create_nc_data_boundaries_check_property_based, data):
     """
     Property based test for the boundaries check when all values are within the specified boundaries
+    :param create_nc_data_boundaries_check_property_based: function creating the netCDF file for the given data
     :param data: all possible lists of integers where all values are inside the range [-10, 40]
     """
-    create_nc_data_boundaries_check_property_based(data=data)
+    nc_path = create_nc_data_boundaries_check_property_based(data=data)
 
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_boundary_property.nc'
     qc_obj.load_netcdf(nc_path)
 
     qc_obj.add_qc_checks_dict(data_boundaries_check_property_based_test_dict)
@@ -251,23 +229,20 @@ def test_data_boundaries_check_property_based_success(data):
     assert not qc_obj.logger.errors
     assert not qc_obj.logger.warnings
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
 
 @settings(deadline=None)
 @given(data=st.lists(st.integers(), max_size=100)
        .filter(lambda lst: any(x < -10 or x > 40 for x in lst)))
-def test_data_boundaries_check_property_based_fail(data):
+def test_data_boundaries_check_property_based_fail(create_nc_data_boundaries_check_property_based, data):
     """
     Property based test for the boundaries check when at least one value is outside the specified boundaries
+    :param create_nc_data_boundaries_check_property_based: function creating the netCDF file for the given data
     :param data: all possible lists of integers where at least value is outside the range [-10, 40]
     """
-    create_nc_data_boundaries_check_property_based(data=data)
+    nc_path = create_nc_data_boundaries_check_property_based(data=data)
 
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_boundary_property.nc'
     qc_obj.load_netcdf(nc_path)
 
     qc_obj.add_qc_checks_dict(data_boundaries_check_property_based_test_dict)
@@ -284,20 +259,16 @@ def test_data_boundaries_check_property_based_fail(data):
     assert len(qc_obj.logger.errors) == expected_errors
     assert not qc_obj.logger.warnings
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
 
-
-@pytest.mark.usefixtures("create_nc_data_boundaries_check_multidim_var")
-def test_data_boundaries_check_multidim_var_success():
+def test_data_boundaries_check_multidim_var_success(create_nc_data_boundaries_check_multidim_var):
     """
     Test for the boundaries check when a variable is multidimensional
     with expected success
+    :param create_nc_data_boundaries_check_multidim_var: path to the netCDF file created by the test fixture
     """
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_boundary_multidim.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj.load_netcdf(create_nc_data_boundaries_check_multidim_var)
 
     qc_obj.add_qc_checks_dict({
         'dimensions': {},
@@ -319,20 +290,16 @@ def test_data_boundaries_check_multidim_var_success():
     assert not qc_obj.logger.warnings
     assert not qc_obj.logger.errors
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
 
-
-@pytest.mark.usefixtures("create_nc_data_boundaries_check_multidim_var")
-def test_data_boundaries_check_multidim_var_fail():
+def test_data_boundaries_check_multidim_var_fail(create_nc_data_boundaries_check_multidim_var):
     """
     Test for the boundaries check when a variable is multidimensional
     with expected failure
+    :param create_nc_data_boundaries_check_multidim_var: path to the netCDF file created by the test fixture
     """
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_boundary_multidim.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj.load_netcdf(create_nc_data_boundaries_check_multidim_var)
 
     qc_obj.add_qc_checks_dict({
         'dimensions': {},
@@ -354,6 +321,3 @@ def test_data_boundaries_check_multidim_var_fail():
     assert not qc_obj.logger.warnings
     assert qc_obj.logger.errors == ["boundary check error: '1.0099999904632568' out of"
                                     " bounds for variable 'var_2d' with bounds [0,1]"]
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
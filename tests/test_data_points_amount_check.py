@@ -1,7 +1,6 @@
 """
 Test module for the data_points_amount_check from QCnetCDF.py
 """
-import os
 import unittest
 from pathlib import Path
 
@@ -9,9 +8,6 @@ import pytest
 
 from ncqc.QCnetCDF import QualityControl
 
-data_dir = Path(__file__).parent.parent / 'sample_data'
-nc_path = data_dir / 'test_data_points_amount.nc'
-
 
 class TestDataPointsAmountCheck(unittest.TestCase):
     """
@@ -30,13 +26,23 @@ class TestDataPointsAmountCheck(unittest.TestCase):
       with an expected error for a netCDF file not being loaded
     """
 
-    @pytest.mark.usefixtures("create_nc_data_points_amount_check")
+    # set for each test by the _nc_path fixture
+    nc_path: Path = None
+
+    @pytest.fixture(autouse=True)
+    def _nc_path(self, create_nc_data_points_amount_check):
+        """
+        Stores the path to the netCDF file created by the test fixture on the test object
+        :param create_nc_data_points_amount_check: path to the netCDF file created by the test fixture
+        """
+        self.nc_path = create_nc_data_points_amount_check
+
     def test_data_points_amount_check_success(self):
         """
         Testing the data_points_amount_check method from QCnetCDF.py with expected success
         """
         qc_obj = QualityControl()
-        qc_obj.load_netcdf(nc_path)
+        qc_obj.load_netcdf(self.nc_path)
         qc_obj.add_qc_checks_dict({
             'dimensions': {},
             'variables': {
@@ -59,16 +65,13 @@ class TestDataPointsAmountCheck(unittest.TestCase):
         qc_obj.data_points_amount_check()
         assert qc_obj.logger.info == ["data points amount check for variable 'var_1d': SUCCESS",
                                       "data points amount check for variable 'var_2d': SUCCESS"]
-        if os.path.exists(nc_path):
-            os.remove(nc_path)
 
-    @pytest.mark.usefixtures("create_nc_data_points_amount_check")
     def test_data_points_amount_check_omit_a_var(self):
         """
         Testing the data_points_amount_check method from QCnetCDF.py when omitting a variable
         """
         qc_obj = QualityControl()
-        qc_obj.load_netcdf(nc_path)
+        qc_obj.load_netcdf(self.nc_path)
         qc_obj.add_qc_checks_dict({
             'dimensions': {},
             'variables': {
@@ -87,17 +90,14 @@ class TestDataPointsAmountCheck(unittest.TestCase):
         })
         qc_obj.data_points_amount_check()
         assert qc_obj.logger.info == ["data points amount check for variable 'var_1d': SUCCESS"]
-        if os.path.exists(nc_path):
-            os.remove(nc_path)
 
-    @pytest.mark.usefixtures("create_nc_data_points_amount_check")
     def test_data_points_amount_check_fail(self):
         """
         Testing the data_points_amount_check method from QCnetCDF.py
         with expected failure for one of the checks
         """
         qc_obj = QualityControl()
-        qc_obj.load_netcdf(nc_path)
+        qc_obj.load_netcdf(self.nc_path)
         qc_obj.add_qc_checks_dict({
             'dimensions': {},
             'variables': {
@@ -122,17 +122,14 @@ class TestDataPointsAmountCheck(unittest.TestCase):
                                       "data points amount check for variable 'var_2d': FAIL"]
         assert qc_obj.logger.errors == ["data points amount check error: number of data points (200)"
                                         " for variable 'var_2d' is below the specified minimum (201)"]
-        if os.path.exists(nc_path):
-            os.remove(nc_path)
 
-    @pytest.mark.usefixtures("create_nc_data_points_amount_check")
     def test_data_points_amount_check_no_such_var(self):
         """
         Testing the data_points_amount_check method from
         QCnetCDF.py with an expected warning for the variable specified not existing
         """
         qc_obj = QualityControl()
-        qc_obj.load_netcdf(nc_path)
+        qc_obj.load_netcdf(self.nc_path)
         qc_obj.add_qc_checks_dict({
             'dimensions': {},
             'variables': {
@@ -150,8 +147,6 @@ class TestDataPointsAmountCheck(unittest.TestCase):
         assert not qc_obj.logger.info
         assert not qc_obj.logger.errors
         assert qc_obj.logger.warnings == ["variable 'var_3d' not in nc file"]
-        if os.path.exists(nc_path):
-            os.remove(nc_path)
 
     def test_data_points_amount_check_no_nc(self):
         """
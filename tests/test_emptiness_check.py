@@ -9,14 +9,8 @@ Module for testing the functionality of the emptiness check.
 - test_emptiness_check_all_false: Test for the emptiness check with nothing to be checked.
 """
 
-import os
-from pathlib import Path
-import pytest
-
 from ncqc.QCnetCDF import QualityControl
 
-data_dir = Path(__file__).parent.parent / 'sample_data'
-
 
 def test_emptiness_check_no_nc():
     """
@@ -30,16 +24,15 @@ def test_emptiness_check_no_nc():
     assert not qc_obj.logger.info
 
 
-@pytest.mark.usefixtures("create_nc_emptiness_check_full")
-def test_emptiness_check_full():
+def test_emptiness_check_full(create_nc_emptiness_check_full):
     """
     Test for the emptiness check with some variables and global attributes to be checked,
     of which all are fully populated, and some that should not be checked at all.
+    :param create_nc_emptiness_check_full: path to the netCDF file created by the test fixture
     """
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_emptiness_full.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj.load_netcdf(create_nc_emptiness_check_full)
 
     qc_obj.qc_checks_vars = {
         'temperature': {'emptiness_check': True},
@@ -68,19 +61,15 @@ def test_emptiness_check_full():
     assert qc_obj.logger.warnings == expected_warnings
     assert qc_obj.logger.info == expected_info
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
 
-@pytest.mark.usefixtures("create_nc_emptiness_check_mixed")
-def test_emptiness_check_mixed():
+def test_emptiness_check_mixed(create_nc_emptiness_check_mixed):
     """
     Test for the emptiness check with some variables and global attributes which are not (fully) populated.
+    :param create_nc_emptiness_check_mixed: path to the netCDF file created by the test fixture
     """
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_emptiness_mixed.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj.load_netcdf(create_nc_emptiness_check_mixed)
 
     qc_obj.qc_checks_vars = {
         'temperature': {'emptiness_check': True},
@@ -115,19 +104,15 @@ def test_emptiness_check_mixed():
     assert qc_obj.logger.warnings == expected_warnings
     assert qc_obj.logger.info == expected_info
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
 
-
-@pytest.mark.usefixtures("create_nc_emptiness_check_empty")
-def test_emptiness_check_all_empty():
+def test_emptiness_check_all_empty(create_nc_emptiness_check_empty):
     """
     Test for the emptiness check with only variables and global attributes which are empty.
+    :param create_nc_emptiness_check_empty: path to the netCDF file created by the test fixture
     """
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_emptiness_empty.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj.load_netcdf(create_nc_emptiness_check_empty)
 
     qc_obj.qc_checks_vars = {
         'temperature': {'emptiness_check': True},
@@ -159,19 +144,15 @@ def test_emptiness_check_all_empty():
     assert qc_obj.logger.warnings == expected_warnings
     assert qc_obj.logger.info == expected_info
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
 
-@pytest.mark.usefixtures("create_nc_emptiness_check_full")
-def test_emptiness_check_all_false():
+def test_emptiness_check_all_false(create_nc_emptiness_check_full):
     """
     Test for the emptiness check with nothing to be checked.
+    :param create_nc_emptiness_check_full: path to the netCDF file created by the test fixture
     """
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_emptiness_full.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj.load_netcdf(create_nc_emptiness_check_full)
 
     qc_obj.qc_checks_vars = {
         'example_variable': {'emptiness_check': False}
@@ -192,6 +173,3 @@ def test_emptiness_check_all_false():
     assert qc_obj.logger.errors == expected_errors
     assert qc_obj.logger.warnings == expected_warnings
     assert qc_obj.logger.info == expected_info
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
@@ -9,14 +9,8 @@ Module for testing the functionality of the existence check.
 - test_existence_check_all_false: Test for the existence check with nothing to be checked.
 """
 
-import os
-from pathlib import Path
-import pytest
-
 from ncqc.QCnetCDF import QualityControl
 
-data_dir = Path(__file__).parent.parent / 'sample_data'
-
 
 def test_existence_check_no_nc():
     """
@@ -30,16 +24,15 @@ def test_existence_check_no_nc():
     assert not qc_obj.logger.info
 
 
-@pytest.mark.usefixtures("create_nc_existence_check")
-def test_existence_check_all_exist():
+def test_existence_check_all_exist(create_nc_existence_check):
     """
     Test for the existence check with some dimensions, variables, and global attributes to be checked,
     which all exist, and some that should not be checked at all.
+    :param create_nc_existence_check: path to the netCDF file created by the test fixture
     """
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_existence.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj.load_netcdf(create_nc_existence_check)
 
     qc_obj.qc_checks_dims = {
         'time': {'existence_check': True},
@@ -71,20 +64,16 @@ def test_existence_check_all_exist():
     assert qc_obj.logger.warnings == expected_warnings
     assert qc_obj.logger.info == expected_info
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
 
-@pytest.mark.usefixtures("create_nc_existence_check")
-def test_existence_check_mixed():
+def test_existence_check_mixed(create_nc_existence_check):
     """
     Test for the existence check with some dimensions, variables, and global attributes to be checked,
     of which some do not exist, and some that should not be checked at all.
+    :param create_nc_existence_check: path to the netCDF file created by the test fixture
     """
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_existence.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj.load_netcdf(create_nc_existence_check)
 
     qc_obj.qc_checks_dims = {
         'time': {'existence_check': True},
@@ -121,19 +110,15 @@ def test_existence_check_mixed():
     assert qc_obj.logger.warnings == expected_warnings
     assert qc_obj.logger.info == expected_info
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
 
-
-@pytest.mark.usefixtures("create_nc_existence_check")
-def test_existence_check_none_exist():
+def test_existence_check_none_exist(create_nc_existence_check):
     """
     Test for the existence check when nothing exists.
+    :param create_nc_existence_check: path to the netCDF file created by the test fixture
     """
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_existence.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj.load_netcdf(create_nc_existence_check)
 
     qc_obj.qc_checks_dims = {
         'bad_dimension': {'existence_check': True}
@@ -163,19 +148,15 @@ def test_existence_check_none_exist():
     assert qc_obj.logger.warnings == expected_warnings
     assert qc_obj.logger.info == expected_info
 
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
-
 
-@pytest.mark.usefixtures("create_nc_existence_check")
-def test_existence_check_all_false():
+def test_existence_check_all_false(create_nc_existence_check):
     """
     Test for the existence check with nothing to be checked.
+    :param create_nc_existence_check: path to the netCDF file created by the test fixture
     """
     qc_obj = QualityControl()
 
-    nc_path = data_dir / 'test_existence.nc'
-    qc_obj.load_netcdf(nc_path)
+    qc_obj.load_netcdf(create_nc_existence_check)
 
     qc_obj.qc_checks_dims = {
         'example_dimension': {'existence_check': False}
@@ -200,6 +181,3 @@ def test_existence_check_all_false():
     assert qc_obj.logger.errors == expected_errors
     assert qc_obj.logger.warnings == expected_warnings
     assert qc_obj.logger.info == expected_info
-
-    if os.path.exists(nc_path):
-        os.remove(nc_path)
@@ -8,6 +8,7 @@ from unittest.mock import patch, Mock
 from ncqc.QCnetCDF import QualityControl
 
 data_dir = Path(__file__).parent.parent / 'sample_data'
+example_config_path = data_dir / 'example_config.yaml'
 
 
 class TestFileSizeCheck(unittest.TestCase):
@@ -36,7 +37,7 @@ class TestFileSizeCheck(unittest.TestCase):
         :param mock_path_stat: Mock object for the Path.stat call
         """
         qc_obj = QualityControl()
-        qc_obj.add_qc_checks_conf(data_dir / 'example_config.yaml')
+        qc_obj.add_qc_checks_conf(example_config_path)
         mock_nc = Mock()
         mock_nc.filepath.return_value = 'dummy/path'
         qc_obj.nc = mock_nc
@@ -51,7 +52,7 @@ class TestFileSizeCheck(unittest.TestCase):
         :param mock_path_stat: Mock object for the Path.stat call
         """
         qc_obj = QualityControl()
-        qc_obj.add_qc_checks_conf(data_dir / 'example_config.yaml')
+        qc_obj.add_qc_checks_conf(example_config_path)
         mock_nc = Mock()
         mock_nc.filepath.return_value = 'dummy/path'
         qc_obj.nc = mock_nc
@@ -68,7 +69,7 @@ class TestFileSizeCheck(unittest.TestCase):
         :param mock_path_stat: Mock object for the Path.stat call
         """
         qc_obj = QualityControl()
-        qc_obj.add_qc_checks_conf(data_dir / 'example_config.yaml')
+        qc_obj.add_qc_checks_conf(example_config_path)
         mock_nc = Mock()
         mock_nc.filepath.return_value = 'dummy/path'
         qc_obj.nc = mock_nc
@@ -92,7 +93,7 @@ class TestFileSizeCheck(unittest.TestCase):
         :param mock_path_stat: Mock object for the Path.stat call
         """
         qc_obj = QualityControl()
-        qc_obj.add_qc_checks_conf(data_dir / 'example_config.yaml')
+        qc_obj.add_qc_checks_conf(example_config_path)
         mock_nc = Mock()
         mock_nc.filepath.return_value = 'dummy/path'
         qc_obj.nc = mock_nc
@@ -115,7 +116,7 @@ class TestFileSizeCheck(unittest.TestCase):
         """
         qc_obj = QualityControl()
         qc_obj.nc = Mock()
-        qc_obj.add_qc_checks_conf(data_dir / 'example_config.yaml')
+        qc_obj.add_qc_checks_conf(example_config_path)
         qc_obj.qc_check_file_size = {}
         res = qc_obj.file_size_check()
         assert res == qc_obj
@@ -1,7 +1,6 @@
 """
 Module for testing the perform_all_checks method from the QualityControl class
 """
-import os
 import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -11,6 +10,7 @@ import pytest
 from ncqc.QCnetCDF import QualityControl
 
 data_dir = Path(__file__).parent.parent / 'sample_data'
+example_config_path = data_dir / 'example_config.yaml'
 
 
 class TestCheck(unittest.TestCase):
@@ -25,6 +25,20 @@ class TestCheck(unittest.TestCase):
     - test_perform_all_checks_all_fail: Test method for when most checks fail
     """
 
+    # set for each test by the _nc_paths fixture
+    nc_path_data_points_amount: Path = None
+    nc_path_all_checks: Path = None
+
+    @pytest.fixture(autouse=True)
+    def _nc_paths(self, create_nc_data_points_amount_check, create_nc_all_checks):
+        """
+        Stores the paths to the netCDF files created by the test fixtures on the test object
+        :param create_nc_data_points_amount_check: path to the netCDF file for the data points amount check
+        :param create_nc_all_checks: path to the netCDF file for testing all checks
+        """
+        self.nc_path_data_points_amount = create_nc_data_points_amount_check
+        self.nc_path_all_checks = create_nc_all_checks
+
     def test_perform_all_checks_no_nc(self):
         """
         Test method for when there is no netCDF file loaded
@@ -35,31 +49,24 @@ class TestCheck(unittest.TestCase):
         assert not qc_obj.logger.warnings
         assert qc_obj.logger.errors == ['perform_all_checks error: no nc file loaded']
 
-    @pytest.mark.usefixtures("create_nc_data_points_amount_check")
     def test_perform_all_checks_no_such_var(self):
         """
         Test method for when a variable specified in the config file does not exist in the netCDF file
         """
-        nc_path = data_dir / 'test_data_points_amount.nc'
         qc_obj = QualityControl()
-        qc_obj.load_netcdf(nc_path)
-        qc_obj.add_qc_checks_conf(data_dir / 'example_config.yaml')
+        qc_obj.load_netcdf(self.nc_path_data_points_amount)
+        qc_obj.add_qc_checks_conf(example_config_path)
         qc_obj.perform_all_checks()
         assert qc_obj.logger.warnings == ["variable 'example_variable' not in nc file"]
 
-        if os.path.exists(nc_path):
-            os.remove(nc_path)
-
-    @pytest.mark.usefixtures("create_nc_all_checks")
     @patch('ncqc.QCnetCDF.Path.stat', return_value=Mock(st_size=150))
     def test_perform_all_checks_all_success(self, mock_path_stat):
         """
         Test method for when all checks succeed
         :param mock_path_stat: Mock object for the Path.stat call
         """
-        nc_path = data_dir / 'test_all_checks.nc'
         qc_obj = QualityControl()
-        qc_obj.load_netcdf(nc_path)
+        qc_obj.load_netcdf(self.nc_path_all_checks)
         qc_obj.add_qc_checks_dict({
             'dimensions': {'dim_1': {'existence_check': True}},
             'variables': {
@@ -112,19 +119,14 @@ class TestCheck(unittest.TestCase):
             "adjacent_values_difference_check for variable 'var_2' and dimension '0': SUCCESS"
         ]
 
-        if os.path.exists(nc_path):
-            os.remove(nc_path)
-
-    @pytest.mark.usefixtures("create_nc_all_checks")
     @patch('ncqc.QCnetCDF.Path.stat', return_value=Mock(st_size=150))
     def test_perform_all_checks_all_fail(self, mock_path_stat):
         """
         Test method for when most checks fail
         :param mock_path_stat: Mock object for the Path.stat call
         """
-        nc_path = data_dir / 'test_all_checks.nc'
         qc_obj = QualityControl()
-        qc_obj.load_netcdf(nc_path)
+        qc_obj.load_netcdf(self.nc_path_all_checks)
         qc_obj.add_qc_checks_dict({
             'dimensions': {'dim_no_such': {'existence_check': True}},
             'variables': {
@@ -178,6 +180,3 @@ class TestCheck(unittest.TestCase):
             "adjacent_values_difference_check for variable 'var_1' and dimension '0': FAIL",
             "adjacent_values_difference_check for variable 'var_2' and dimension '0': FAIL"
         ]
-
-        if os.path.exists(nc_path):
-            os.remove(nc_path)